@@ -1,20 +1,30 @@
+import os
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from urllib.parse import urlencode, urlparse, urlunparse, parse_qs, urljoin
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
 from .models import SummaryItem
-from .search import DEFAULT_STREAMS
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
-# Build display-name lookup from the canonical SectionConfig definitions
-SECTION_LABELS: Dict[str, str] = {key: cfg.name for key, cfg in DEFAULT_STREAMS.items()}
 
-SECTION_LABELS_FR: Dict[str, str] = {
+@lru_cache(maxsize=1)
+def _section_labels() -> Mapping[str, str]:
+    """Display-name lookup built from the canonical SectionConfig definitions.
+
+    Imported lazily: .search pulls in feedparser, duckduckgo_search and the
+    collectors, none of which rendering from cached JSON (api/render) needs.
+    """
+    from .search import DEFAULT_STREAMS
+    return MappingProxyType({key: cfg.name for key, cfg in DEFAULT_STREAMS.items()})
+
+SECTION_LABELS_FR: Mapping[str, str] = MappingProxyType({
     "trending": "IA en vedette",
     "canadian": "Nouvelles canadiennes",
     "global": "Nouvelles internationales",
@@ -22,9 +32,9 @@ SECTION_LABELS_FR: Dict[str, str] = {
     "ai_progress": "Progrès en IA",
     "research_plain": "Recherche en IA",
     "deep_dive": "Analyse approfondie",
-}
+})
 
-SECTION_DESCRIPTIONS: Dict[str, str] = {
+SECTION_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
     "trending": "The biggest AI stories everyone is talking about this week.",
     "canadian": "AI developments directly affecting Canadian federal and provincial policy.",
     "global": "International AI governance, regulation, and workforce policy.",
@@ -32,9 +42,9 @@ SECTION_DESCRIPTIONS: Dict[str, str] = {
     "ai_progress": "Notable benchmark results and technical capability milestones.",
     "research_plain": "Cutting-edge AI research and breakthroughs.",
     "deep_dive": "In-depth reports and analyses from leading AI organizations.",
-}
+})
 
-SECTION_DESCRIPTIONS_FR: Dict[str, str] = {
+SECTION_DESCRIPTIONS_FR: Mapping[str, str] = MappingProxyType({
     "trending": "Les plus grandes nouvelles en IA dont tout le monde parle cette semaine.",
     "canadian": "Développements en IA touchant directement les politiques fédérales et provinciales canadiennes.",
     "global": "Gouvernance, réglementation et politiques internationales en matière d'IA.",
@@ -42,11 +52,11 @@ SECTION_DESCRIPTIONS_FR: Dict[str, str] = {
     "ai_progress": "Résultats de référence et jalons techniques notables.",
     "research_plain": "Recherche de pointe et percées en IA.",
     "deep_dive": "Rapports et analyses approfondis des grandes organisations en IA.",
-}
+})
 
-# UI strings for template chrome
-UI_STRINGS = {
-    "en": {
+# UI strings for template chrome (read-only: shared by every render)
+UI_STRINGS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "en": MappingProxyType({
         "title": "AI This Week",
         "date_label": "Date:",
         "tldr_title": "⚡ TL;DR — This Week's Top 3",
@@ -54,8 +64,8 @@ UI_STRINGS = {
         "read_more": "Read more →",
         "footer_line1": "AI This Week",
         "footer_line2": "Automated Briefing System",
-    },
-    "fr": {
+    }),
+    "fr": MappingProxyType({
         "title": "IA cette semaine",
         "date_label": "Date :",
         "tldr_title": "⚡ En bref — Les 3 faits saillants",
@@ -63,25 +73,44 @@ UI_STRINGS = {
         "read_more": "Lire la suite →",
         "footer_line1": "🍁 IA cette semaine — Bulletin automatisé sur l'IA pour les fonctionnaires canadiens.",
         "footer_line2": "Sélectionné avec soin. Propulsé par l'intelligence ouverte.",
-    },
-}
+    }),
+})
+
+
+def _utm_params(section_key: str, run_date: str) -> Dict[str, str]:
+    return {
+        "utm_source": "ai_this_week",
+        "utm_medium": "email",
+        "utm_campaign": run_date,
+        "utm_content": section_key,
+    }
+
+
+@lru_cache(maxsize=64)
+def _utm_query(section_key: str, run_date: str) -> str:
+    """Encoded UTM query string — one per (section, date) pair."""
+    return urlencode(_utm_params(section_key, run_date))
 
 
 def _add_utm(url: str, section_key: str, run_date: str) -> str:
     """Append UTM tracking parameters to a URL for engagement analytics."""
     if not url:
         return url
+    # Fast path: nothing to merge with — append the cached query, keeping any
+    # existing query string verbatim
+    if "#" not in url and "utm_" not in url:
+        query = _utm_query(section_key, run_date)
+        if "?" not in url:
+            return f"{url}?{query}"
+        if url.endswith(("?", "&")):
+            return url + query
+        return f"{url}&{query}"
+    # Fragments and existing UTM params need the full, non-overwriting merge
     try:
         parsed = urlparse(url)
         existing_params = parse_qs(parsed.query)
-        utm_params = {
-            "utm_source": "ai_this_week",
-            "utm_medium": "email",
-            "utm_campaign": run_date,
-            "utm_content": section_key,
-        }
         # Don't overwrite existing UTM params
-        for k, v in utm_params.items():
+        for k, v in _utm_params(section_key, run_date).items():
             if k not in existing_params:
                 existing_params[k] = [v]
         new_query = urlencode(existing_params, doseq=True)
@@ -90,10 +119,61 @@ def _add_utm(url: str, section_key: str, run_date: str) -> str:
         return url  # on any parsing error, return original
 
 
-def _get_env() -> Environment:
-    loader = FileSystemLoader(str(PROJECT_ROOT / "template"))
-    env = Environment(loader=loader, autoescape=select_autoescape(["html", "xml"]))
-    return env
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """A bytecode cache that never breaks rendering: failed writes are ignored."""
+
+    def dump_bytecode(self, bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Compiled-template cache dir — tries the project root first, falls back to /tmp.
+
+    Vercel serverless mounts the project read-only, and an existing cache dir
+    there can be unwritable, so each candidate is checked for write access.
+    """
+    for cache_dir in (PROJECT_ROOT / ".jinja_cache", Path("/tmp") / ".jinja_cache"):
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(cache_dir, os.W_OK):
+            return _BestEffortBytecodeCache(directory=str(cache_dir))
+    return None  # compile templates in memory only
+
+
+@lru_cache(maxsize=2)
+def _language_context(lang: str) -> Mapping[str, Mapping[str, str]]:
+    """Language-specific template resources, selected once per language."""
+    if lang == "fr":
+        return MappingProxyType({
+            "section_labels": SECTION_LABELS_FR,
+            "section_descriptions": SECTION_DESCRIPTIONS_FR,
+            "ui": UI_STRINGS["fr"],
+        })
+    return MappingProxyType({
+        "section_labels": _section_labels(),
+        "section_descriptions": SECTION_DESCRIPTIONS,
+        "ui": UI_STRINGS["en"],
+    })
+
+
+def _event_date(item: SummaryItem) -> str:
+    return item.Date or ""
+
+
+# Build the Jinja environment and compile the template once per process.
+# auto_reload is off: the template ships with the code and never changes at runtime.
+_ENV = Environment(
+    loader=FileSystemLoader(str(PROJECT_ROOT / "template")),
+    autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,
+    bytecode_cache=_get_bytecode_cache(),
+)
+_TEMPLATE = _ENV.get_template("newsletter.html.j2")
 
 
 def render_newsletter(
@@ -102,18 +182,12 @@ def render_newsletter(
     tldr: Optional[List[str]] = None,
     lang: str = "en",
 ) -> str:
-    env = _get_env()
-    template = env.get_template("newsletter.html.j2")
-
     effective_date = run_date or date.today().isoformat()
 
-    # Sort events by date when available
+    # Sort events by date when available — in place (stable, keys computed once per
+    # item); render_newsletter already owns and mutates the section lists.
     if "events" in sections:
-        events = sections["events"]
-        sections["events"] = sorted(
-            events,
-            key=lambda x: x.Date or "",
-        )
+        sections["events"].sort(key=_event_date)
 
     # Apply UTM tracking to all Live_Link URLs
     for section_key, items in sections.items():
@@ -121,19 +195,12 @@ def render_newsletter(
             if item.Live_Link:
                 item.Live_Link = _add_utm(item.Live_Link, section_key, effective_date)
 
-    # Select language-specific resources
-    labels = SECTION_LABELS_FR if lang == "fr" else SECTION_LABELS
-    descriptions = SECTION_DESCRIPTIONS_FR if lang == "fr" else SECTION_DESCRIPTIONS
-    strings = UI_STRINGS.get(lang, UI_STRINGS["en"])
-
-    return template.render(
+    return _TEMPLATE.render(
+        _language_context("fr" if lang == "fr" else "en"),
         run_date=effective_date,
         sections=sections,
-        section_labels=labels,
-        section_descriptions=descriptions,
         tldr=tldr or [],
         lang=lang,
-        ui=strings,
     )
 
 
@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -10,7 +11,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     tavily_api_key: str
     gemini_api_key: str
@@ -24,7 +25,9 @@ class Settings:
         return date.today().isoformat()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Settings from the environment, read once per process (missing keys are not cached)."""
     tavily = os.getenv("TAVILY_API_KEY", "")
     gemini = os.getenv("GEMINI_API_KEY", "")
     if not tavily:
@@ -1,25 +1,196 @@
 """Semantic deduplication — removes near-duplicate articles covering the same story."""
 
+import hashlib
 import logging
+import random
+import re
+from collections import defaultdict
 from difflib import SequenceMatcher
-from typing import List
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from .models import VerifiedArticle
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is in requirements.txt; difflib keeps dedup working without it
+    fuzz = process = None
+
 log = logging.getLogger(__name__)
 
 # Articles with title similarity above this threshold are considered duplicates
 _SIMILARITY_THRESHOLD = 0.6
 
+# Word-set Jaccard is the first, cheap test: pairs whose overlap reaches the
+# similarity threshold are duplicates outright, pairs sharing no word are
+# distinct, and only the grey zone in between falls through to the
+# character-level ratio. Punctuation inside a word is dropped ("GPT-5" → "gpt5")
+# so compound-token variants still share a token.
+_TITLE_PUNCT_RE = re.compile(r"[^\w\s]+")
+_TOKEN_RE = re.compile(r"\w+")
+
+# ── MinHash / LSH candidate generation for article bodies ──
+# Titles are always compared pairwise: rapidfuzz scores a few hundred titles
+# faster than pure-Python MinHash can sign them. Bodies carry thousands of
+# shingles each, so at _CONTENT_LSH_MIN_ARTICLES and above (measured crossover
+# ~350 bodies) they are bucketed by banded MinHash signatures and only bucket
+# mates are compared. A section rarely verifies more than ~20 articles.
+_CONTENT_LSH_MIN_ARTICLES = 400
+_NUM_PERM = 64
+_LSH_BANDS = 16  # 16 bands x 4 rows → candidate threshold ≈ (1/16)^(1/4) ≈ 0.5
+_MERSENNE_PRIME = (1 << 61) - 1
+# Body text is compared on 13-word shingles: long enough that boilerplate and
+# shared quotes rarely collide, so high overlap means a syndicated/reposted story.
+_CONTENT_SHINGLE_WORDS = 13
+_CONTENT_JACCARD_THRESHOLD = 0.7
+# Shorter bodies are usually a consent page, an interstitial or a feed snippet
+# fallback; unrelated stories can share those, so they are never body-matched
+_MIN_CONTENT_CHARS = 500
+_rng = random.Random(42)  # fixed seed: signatures must be stable across runs
+_PERMUTATIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(_NUM_PERM)
+)
+
 
 def _title_similarity(a: str, b: str) -> float:
-    """Case-insensitive SequenceMatcher ratio between two titles."""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    """Case-insensitive similarity ratio (0.0-1.0) between two titles.
+
+    rapidfuzz's C++ Indel ratio computes the same 2*M/T score as difflib's
+    SequenceMatcher at a fraction of the cost; difflib is the fallback.
+    """
+    return _ratio(a.lower(), b.lower())
+
+
+def _ratio(a: str, b: str) -> float:
+    """Similarity ratio of two already-lowercased strings."""
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _token_set(title: str) -> FrozenSet[str]:
+    """Lowercased word tokens of a title, with punctuation inside words removed."""
+    return frozenset(_TITLE_PUNCT_RE.sub("", title.lower()).split())
+
+
+def _token_jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity between two token sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _titles_match(
+    tokens_a: FrozenSet[str],
+    tokens_b: FrozenSet[str],
+    title_a: str,
+    title_b: str,
+    threshold: float,
+) -> bool:
+    """Jaccard first; the character ratio only settles the ambiguous middle band.
+
+    *title_a* and *title_b* must already be lowercased.
+    """
+    jaccard = _token_jaccard(tokens_a, tokens_b)
+    if jaccard >= threshold:
+        return True
+    if jaccard == 0.0:
+        return False
+    # The ratio is 2*M / (len_a + len_b) with M <= the shorter length, so titles of
+    # very different lengths can never reach the threshold — skip the O(n·m) match.
+    shorter, longer = sorted((len(title_a), len(title_b)))
+    if 2 * shorter < threshold * (shorter + longer):
+        return False
+    return _ratio(title_a, title_b) >= threshold
+
+
+def _ratio_pairs(lowered: List[str], threshold: float) -> Optional[Set[Tuple[int, int]]]:
+    """All (i, j) with i < j whose character ratio reaches *threshold*.
+
+    Each row is scored against the remaining titles in a single rapidfuzz call
+    (C++ loop with score-cutoff early exit). Returns None without rapidfuzz.
+    """
+    if process is None:
+        return None
+    cutoff = threshold * 100
+    pairs: Set[Tuple[int, int]] = set()
+    for i in range(len(lowered) - 1):
+        for _, _, k in process.extract_iter(
+            lowered[i], lowered[i + 1:], scorer=fuzz.ratio, score_cutoff=cutoff,
+        ):
+            pairs.add((i, i + 1 + k))
+    return pairs
+
 
+def _minhash(shingles: Iterable[str]) -> Tuple[int, ...]:
+    """MinHash signature of a shingle set using fixed universal hash permutations."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+        for s in shingles
+    ]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
 
-def _best_article(group: List[VerifiedArticle]) -> VerifiedArticle:
-    """From a group of duplicates, keep the one with the richest content."""
-    return max(group, key=lambda a: len(a.content or ""))
+
+def _lsh_pairs(shingle_sets: Dict[int, FrozenSet[str]]) -> Set[Tuple[int, int]]:
+    """Index pairs (i < j) sharing at least one LSH band bucket."""
+    rows = _NUM_PERM // _LSH_BANDS
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+    for idx in sorted(shingle_sets):
+        sig = _minhash(shingle_sets[idx])
+        for band in range(_LSH_BANDS):
+            buckets[(band, sig[band * rows:(band + 1) * rows])].append(idx)
+
+    pairs: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        for pos, i in enumerate(members):
+            pairs.update((i, j) for j in members[pos + 1:])
+    return pairs
+
+
+def _content_shingles(text: str) -> FrozenSet[str]:
+    """13-word shingles of an article body; empty when the body is too short."""
+    words = _TOKEN_RE.findall(text.lower())
+    size = _CONTENT_SHINGLE_WORDS
+    return frozenset(" ".join(words[i:i + size]) for i in range(len(words) - size + 1))
+
+
+def _content_pairs(contents: List[str]) -> Iterable[Tuple[int, int]]:
+    """Index pairs (i < j) whose bodies are identical or near-identical.
+
+    Verbatim copies are caught by a sha1 digest first; the rest are compared by
+    shingle Jaccard, via MinHash LSH buckets once the batch is large. Bodies
+    under _MIN_CONTENT_CHARS are skipped by both tests.
+    """
+    first_by_digest: Dict[bytes, int] = {}
+    for idx, text in enumerate(contents):
+        if len(text) < _MIN_CONTENT_CHARS:
+            continue
+        digest = hashlib.sha1(text.encode("utf-8")).digest()
+        if digest in first_by_digest:
+            yield first_by_digest[digest], idx
+        else:
+            first_by_digest[digest] = idx
+
+    # Only the first copy of each exact body needs the near-duplicate test
+    unique = sorted(first_by_digest.values())
+    shingles = {idx: _content_shingles(contents[idx]) for idx in unique}
+    unique = [idx for idx in unique if shingles[idx]]
+
+    if len(unique) >= _CONTENT_LSH_MIN_ARTICLES:
+        candidate_pairs: Iterable[Tuple[int, int]] = sorted(
+            _lsh_pairs({idx: shingles[idx] for idx in unique})
+        )
+    else:
+        candidate_pairs = (
+            (i, j) for pos, i in enumerate(unique) for j in unique[pos + 1:]
+        )
+
+    for i, j in candidate_pairs:
+        if _token_jaccard(shingles[i], shingles[j]) >= _CONTENT_JACCARD_THRESHOLD:
+            yield i, j
 
 
 def deduplicate(
@@ -28,37 +199,66 @@ def deduplicate(
 ) -> List[VerifiedArticle]:
     """Remove near-duplicate articles, keeping the highest-quality version.
 
-    Uses title similarity via SequenceMatcher (no API calls needed).
-    Preserves original ordering of the kept articles.
+    Titles are compared by word-set Jaccard, with a character-level ratio as the
+    tie-breaker for partial overlaps (no API calls needed). Articles with
+    identical or near-identical bodies (re-headlined syndication) are merged
+    too. Preserves original ordering of the kept articles.
     """
     if len(articles) <= 1:
         return articles
 
-    # Build clusters of similar articles
-    clusters: List[List[int]] = []  # each cluster is a list of indices
-    assigned: set = set()
+    # Lowercase each title once rather than on every pairwise comparison
+    lowered = [a.title.lower() for a in articles]
+    token_sets = [_token_set(t) for t in lowered]
+
+    # Every pair is compared — score the character ratios in batch
+    ratio_pairs = _ratio_pairs(lowered, threshold)
+
+    # Cluster with union-find so similarity is transitive (A~B, B~C ⇒ one story)
+    parent = list(range(len(articles)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(i: int, j: int) -> None:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    for i, j in _content_pairs([a.content or "" for a in articles]):
+        union(i, j)
 
     for i in range(len(articles)):
-        if i in assigned:
-            continue
-        cluster = [i]
-        assigned.add(i)
         for j in range(i + 1, len(articles)):
-            if j in assigned:
-                continue
-            if _title_similarity(articles[i].title, articles[j].title) >= threshold:
-                cluster.append(j)
-                assigned.add(j)
-        clusters.append(cluster)
-
-    # Pick the best article from each cluster, preserving order
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
+                continue  # already linked through another pair
+            if ratio_pairs is not None:
+                jaccard = _token_jaccard(token_sets[i], token_sets[j])
+                matched = jaccard >= threshold or (jaccard > 0.0 and (i, j) in ratio_pairs)
+            else:
+                matched = _titles_match(token_sets[i], token_sets[j], lowered[i], lowered[j], threshold)
+            if matched:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    # Group by root; roots are the smallest index, so clusters come out in input order
+    groups: Dict[int, List[int]] = {}
+    for idx in range(len(articles)):
+        groups.setdefault(find(idx), []).append(idx)
+    clusters = list(groups.values())
+
+    # Pick the best article (richest content) from each cluster, preserving order
+    sizes = [len(a.content or "") for a in articles]
     result: List[VerifiedArticle] = []
     for cluster in clusters:
-        group = [articles[idx] for idx in cluster]
-        best = _best_article(group)
+        best_idx = max(cluster, key=sizes.__getitem__)
+        best = articles[best_idx]
         result.append(best)
         if len(cluster) > 1:
-            dupes = [articles[idx].title for idx in cluster if articles[idx] != best]
+            dupes = [articles[idx].title for idx in cluster if idx != best_idx]
             log.info("Dedup: kept '%s', removed %d duplicates: %s", best.title, len(dupes), dupes)
 
     log.info("Deduplicated %d → %d articles", len(articles), len(result))
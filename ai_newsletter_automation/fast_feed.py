@@ -0,0 +1,84 @@
+"""Minimal RSS 2.0 / RSS 1.0 / Atom entry extractor on lxml's iterparse.
+
+The collectors only read a handful of entry fields, so this skips feedparser's
+sanitising and per-element handler dispatch. Field mapping mirrors feedparser:
+dc:date counts as ``updated``, Atom ``content`` stands in for a missing
+``summary`` and a permalink ``guid`` for a missing ``link``.
+"""
+
+from io import BytesIO
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+try:
+    from lxml import etree
+except ImportError:  # callers fall back to feedparser
+    etree = None
+
+_ENTRY_TAGS = frozenset({"item", "entry"})
+_SUMMARY_TAGS = frozenset({"description", "summary"})
+_CONTENT_TAGS = frozenset({"encoded", "content"})
+_PUBLISHED_TAGS = frozenset({"pubDate", "published", "issued"})
+_UPDATED_TAGS = frozenset({"updated", "modified", "date"})
+
+
+def _local(tag) -> str:
+    # Comments and processing instructions have a non-string tag
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _text(el) -> str:
+    return "".join(el.itertext()).strip()
+
+
+def _entry(el, base_url: str) -> Dict[str, Optional[str]]:
+    fields: Dict[str, Optional[str]] = {}
+    guid = None
+    for child in el:
+        name = _local(child.tag)
+        if name == "title":
+            fields.setdefault("title", _text(child))
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                fields.setdefault("link", _text(child))
+            elif child.get("rel", "alternate") == "alternate":
+                fields.setdefault("link", href)
+        elif name in _SUMMARY_TAGS:
+            fields.setdefault("summary", _text(child))
+        elif name in _CONTENT_TAGS:
+            fields.setdefault("content", _text(child))
+        elif name in _PUBLISHED_TAGS:
+            fields.setdefault("published", _text(child))
+        elif name in _UPDATED_TAGS:
+            fields.setdefault("updated", _text(child))
+        elif name == "guid" and child.get("isPermaLink", "true") != "false":
+            guid = _text(child)
+
+    content = fields.pop("content", None)
+    if not fields.get("summary") and content:
+        fields["summary"] = content
+    link = fields.get("link") or guid
+    if link:
+        fields["link"] = urljoin(base_url, link) if base_url else link
+    return fields
+
+
+def parse(data: bytes, base_url: str = "") -> Optional[List[Dict[str, Optional[str]]]]:
+    """Entries of the feed in *data*, or None if lxml is missing or the XML is unusable.
+
+    Relative links are resolved against *base_url*.
+    """
+    if etree is None:
+        return None
+    entries = []
+    try:
+        for _, el in etree.iterparse(BytesIO(data), events=("end",), recover=True):
+            if _local(el.tag) not in _ENTRY_TAGS:
+                continue
+            entries.append(_entry(el, base_url))
+            # Entries are independent — free each one once it has been read
+            el.clear()
+    except etree.LxmlError:
+        return None
+    return entries
@@ -0,0 +1,93 @@
+"""Conditional-GET cache for RSS/Atom feeds — validators plus the entries last served.
+
+Kept in memory during a run and written back once, when the process exits.
+"""
+
+import atexit
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+# Only the entry fields the collectors read are kept, to keep the file small
+_KEPT_KEYS = ("title", "link", "summary", "published", "published_parsed", "updated_parsed")
+
+_LOCK = threading.Lock()
+_cache: Optional[Dict[str, dict]] = None
+_dirty = False
+
+
+def _get_cache_path() -> Path:
+    """Feed cache file — tries project logs first, falls back to /tmp."""
+    try:
+        from .config import get_settings
+        p = get_settings().project_root / "logs" / "feed_cache.json"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return p
+    except Exception:
+        p = Path("/tmp") / "logs" / "feed_cache.json"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return p
+
+
+def _load() -> Dict[str, dict]:
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(_get_cache_path().read_text(encoding="utf-8"))
+        except Exception:
+            _cache = {}
+    return _cache
+
+
+def validators(url: str) -> Dict[str, str]:
+    """Conditional request headers for *url*, empty when nothing is cached."""
+    with _LOCK:
+        cached = _load().get(url)
+    if not cached:
+        return {}
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
+    return headers
+
+
+def entries(url: str) -> Optional[List[dict]]:
+    """Entries stored for *url* by the last full fetch, or None."""
+    with _LOCK:
+        cached = _load().get(url)
+    return cached["entries"] if cached else None
+
+
+def store(url: str, etag: Optional[str], modified: Optional[str], feed_entries: List[dict]) -> None:
+    """Remember a freshly parsed feed; feeds without validators are not cached."""
+    global _dirty
+    if not etag and not modified:
+        return
+    kept = [{k: e[k] for k in _KEPT_KEYS if k in e} for e in feed_entries]
+    with _LOCK:
+        _load()[url] = {"etag": etag, "modified": modified, "entries": kept}
+        _dirty = True
+
+
+def save() -> None:
+    """Write the cache back if anything changed since the last save."""
+    global _dirty
+    with _LOCK:
+        if not _dirty:
+            return
+        path = _get_cache_path()
+        try:
+            # struct_time dates serialise as 9-item lists, which calendar.timegm still accepts
+            path.write_text(json.dumps(_cache, default=str), encoding="utf-8")
+            _dirty = False
+        except OSError:
+            log.warning("Could not write feed cache to %s", path)
+
+
+atexit.register(save)
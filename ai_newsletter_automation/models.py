@@ -3,7 +3,7 @@ from datetime import date
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleHit:
     title: str
     url: str
@@ -12,7 +12,7 @@ class ArticleHit:
     published: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifiedArticle:
     title: str
     url: str
@@ -22,7 +22,7 @@ class VerifiedArticle:
     scraped_published_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryItem:
     Headline: str
     Summary_Text: str
@@ -32,7 +32,7 @@ class SummaryItem:
     Source: Optional[str] = None  # origin badge e.g. "arXiv", "TBS", "OECD"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SectionConfig:
     name: str
     query: str
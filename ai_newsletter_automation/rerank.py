@@ -8,7 +8,6 @@ from google.api_core import exceptions
 
 import requests
 
-from .config import get_settings
 from .models import VerifiedArticle, SectionConfig
 
 log = logging.getLogger(__name__)
@@ -69,10 +68,10 @@ def rerank_articles(
     if len(articles) <= section.limit:
         return articles
 
-    settings = get_settings()
-    # Configure Gemini
+    # Configure Gemini (shared with summarize; configures once per API key)
     import google.generativeai as genai
-    genai.configure(api_key=settings.gemini_api_key)
+    from .summarize import _configure_gemini
+    _configure_gemini()
     
     prompt = _build_rerank_prompt(section.name, articles)
     
@@ -1,20 +1,31 @@
+import atexit
 import concurrent.futures
+import heapq
 import json
 import os
+import queue
+import re
 import threading
+import time
 from collections import OrderedDict
 from dataclasses import replace
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Callable, Optional
+from urllib.parse import urlsplit
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Callable, Optional, Tuple
 
 import click
 import requests
 
+try:
+    import orjson
+except ImportError:  # orjson is in requirements.txt; stdlib json keeps logging working without it
+    orjson = None
+
 from .assemble import render_newsletter
 from .config import get_settings
 from .models import SummaryItem, VerifiedArticle, ArticleHit, SectionConfig
-from .scrape import scrape, extract_metadata
+from .scrape import fetch_and_extract
 from .search import (
     get_streams,
     search_stream,
@@ -25,20 +36,17 @@ from .search import (
     collect_canadian,
     collect_global,
     collect_deep_dive,
-    _filter_by_keywords,
-    _boost_by_keywords,
-    _boost_by_source_quality,
-    _sort_by_source_priority,
-    _apply_time_decay,
+    _rank_hits,
 )
+from . import feed_cache
 from .dedup import deduplicate
 from .rerank import rerank_articles
-from .source_quality import SourceTracker
+from .source_quality import get_tracker
 from .summarize import summarize_section, generate_tldr
-from .verify import verify_link
+from .verify import canonical_url
 
 
-SECTION_ORDER = [
+SECTION_ORDER = (
     "trending",
     "canadian",
     "global",
@@ -46,40 +54,176 @@ SECTION_ORDER = [
     "ai_progress",
     "research_plain",
     "deep_dive",
-]
+)
 
-_LOG_LOCK = threading.Lock()
+# Dedicated collectors per section; anything else falls back to search_stream.
+# Called as collector(cfg, days) with the section's own window taking precedence.
+_COLLECTORS: Dict[str, Callable[[SectionConfig, int], List[ArticleHit]]] = {
+    "trending": lambda c, d: collect_trending(c.days or d),
+    "events": lambda c, d: collect_events(c.days or d),
+    "research_plain": lambda c, d: collect_research(c.days or d),
+    "ai_progress": lambda c, d: collect_ai_progress(c.days or d),
+    "canadian": lambda c, d: collect_canadian(c.days or d),
+    "global": lambda c, d: collect_global(c.days or d),
+    "deep_dive": lambda c, d: collect_deep_dive(c.days or d),
+}
+
+# Wall-clock budget per section (below the 60 s serverless cap, leaving room for the LLM)
+_SECTION_BUDGET_SECONDS = 45.0
+
+# Skip-log lines are queued and written by one background thread in batches,
+# so worker threads never contend on a lock or open a file per line.
+_LOG_QUEUE: "queue.Queue[Optional[Tuple[Path, str, str]]]" = queue.Queue()
+_LOG_BATCH_LINES = 64
+_LOG_BATCH_SECONDS = 0.5
+_LOG_WRITER_LOCK = threading.Lock()
+_log_writer: Optional[threading.Thread] = None
+
+
+def _log_line(reason: str, url: str) -> bytes:
+    """One JSONL record as bytes — orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps({"reason": reason, "url": url}) + b"\n"
+    return (json.dumps({"reason": reason, "url": url}) + "\n").encode("utf-8")
+
+
+class _LogFiles:
+    """Append handles kept open for the writer thread's lifetime (one open per file)."""
+
+    def __init__(self):
+        self._files: Dict[Path, BinaryIO] = {}
+        self._use_tmp = False  # flipped once if the project log dir is read-only (Vercel)
+
+    def _open(self, log: Path) -> Optional[BinaryIO]:
+        f = self._files.get(log)
+        if f is not None:
+            return f
+        if not self._use_tmp:
+            try:
+                log.parent.mkdir(parents=True, exist_ok=True)
+                f = log.open("ab")
+            except OSError:
+                self._use_tmp = True
+        if f is None:
+            # Vercel serverless: filesystem is read-only, try /tmp
+            try:
+                tmp_log = Path("/tmp") / "logs" / log.name
+                tmp_log.parent.mkdir(parents=True, exist_ok=True)
+                f = tmp_log.open("ab")
+            except OSError:
+                return None  # Give up silently — logging is non-critical
+        self._files[log] = f
+        return f
+
+    def write_batch(self, batch: List[Tuple[Path, str, str]]) -> None:
+        by_path: Dict[Path, List[bytes]] = {}
+        for log, reason, url in batch:
+            by_path.setdefault(log, []).append(_log_line(reason, url))
+        for log, lines in by_path.items():
+            f = self._open(log)
+            if f is None:
+                continue
+            try:
+                f.writelines(lines)
+                f.flush()
+            except OSError:
+                pass
 
+    def close(self) -> None:
+        for f in self._files.values():
+            try:
+                f.close()
+            except OSError:
+                pass
+        self._files.clear()
 
-def _log_skipped(reason: str, url: str, log: Path) -> None:
-    """Best-effort logging — silently skip on read-only filesystems (Vercel)."""
+
+def _log_writer_loop() -> None:
+    files = _LogFiles()
     try:
-        log.parent.mkdir(parents=True, exist_ok=True)
-        # Thread-safe logging
-        with _LOG_LOCK:
-            with log.open("a", encoding="utf-8") as f:
-                f.write(json.dumps({"reason": reason, "url": url}) + "\n")
-    except OSError:
-        # Vercel serverless: filesystem is read-only, try /tmp
-        try:
-            tmp_log = Path("/tmp") / "logs" / log.name
-            tmp_log.parent.mkdir(parents=True, exist_ok=True)
-            with _LOG_LOCK:
-                with tmp_log.open("a", encoding="utf-8") as f:
-                    f.write(json.dumps({"reason": reason, "url": url}) + "\n")
-        except OSError:
-            pass  # Give up silently — logging is non-critical
+        while True:
+            entry = _LOG_QUEUE.get()
+            if entry is None:
+                return
+            batch = [entry]
+            deadline = time.monotonic() + _LOG_BATCH_SECONDS
+            while len(batch) < _LOG_BATCH_LINES:
+                try:
+                    entry = _LOG_QUEUE.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is None:
+                    files.write_batch(batch)
+                    return
+                batch.append(entry)
+            files.write_batch(batch)
+    finally:
+        files.close()
+
 
+def _stop_log_writer() -> None:
+    """Flush queued lines and stop the writer (it restarts on the next log call)."""
+    global _log_writer
+    with _LOG_WRITER_LOCK:
+        writer, _log_writer = _log_writer, None
+    if writer is not None and writer.is_alive():
+        _LOG_QUEUE.put(None)
+        writer.join(timeout=5)
 
-def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArticle]:
+
+atexit.register(_stop_log_writer)
+
+
+def _log_skipped(reason: str, url: str, log: Path) -> None:
+    """Best-effort logging — queued for the background writer, never blocks."""
+    global _log_writer
+    if _log_writer is None:
+        with _LOG_WRITER_LOCK:
+            if _log_writer is None:
+                _log_writer = threading.Thread(
+                    target=_log_writer_loop, name="skip-log-writer", daemon=True
+                )
+                _log_writer.start()
+    _LOG_QUEUE.put_nowait((log, reason, url))
+
+
+# Links that never verify as articles (login walls, JS shells) — skip the round-trip
+_SKIP_SCHEMES = frozenset({"mailto", "javascript", "tel", "data"})
+_SKIP_HOSTS = frozenset({
+    "twitter.com",
+    "x.com",
+    "t.co",
+    "facebook.com",
+    "instagram.com",
+    "tiktok.com",
+    "threads.net",
+})
+
+
+def _process_single_hit(
+    hit: ArticleHit, log_file: Path, stop: Optional[threading.Event] = None
+) -> Optional[VerifiedArticle]:
+    if stop is not None and stop.is_set():
+        return None
     if not hit.url:
         _log_skipped("missing_url", "", log_file)
         return None
 
+    split = urlsplit(hit.url)
+    host = (split.hostname or "").removeprefix("www.").removeprefix("m.")
+    if split.scheme.lower() in _SKIP_SCHEMES or host in _SKIP_HOSTS:
+        _log_skipped("non_article_link", hit.url, log_file)
+        return None
+
+    # One verified GET + one parse yields the HTML, body text and published date
     try:
-        html = verify_link(hit.url)
-    except Exception:
-        html = None
+        html, content, scraped_date = fetch_and_extract(hit.url)
+    except Exception:  # network or decoding trouble — try the snippet below
+        html = content = scraped_date = None
+
+    # Limit was reached while we were fetching — nobody needs this result
+    if stop is not None and stop.is_set():
+        return None
 
     if html is None:
         # Link unreachable — but if we have a good RSS snippet, use it
@@ -96,11 +240,6 @@ def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArt
             _log_skipped("verify_failed", hit.url, log_file)
         return None
 
-    try:
-        content = scrape(hit.url, html=html)
-    except Exception:
-        content = None
-        
     if not content:
         # Scrape failed — fall back to RSS snippet
         if hit.snippet and len(hit.snippet) > 40:
@@ -109,51 +248,74 @@ def _process_single_hit(hit: ArticleHit, log_file: Path) -> Optional[VerifiedArt
         else:
             _log_skipped("scrape_failed", hit.url, log_file)
             return None
-    
-    # Extract metadata (date)
-    try:
-        meta = extract_metadata(html)
-        scraped_date = meta.get("date")
-    except Exception:
-        scraped_date = None
 
     return VerifiedArticle(
         title=hit.title,
         url=hit.url,
         snippet=hit.snippet,
         content=content,
-        published=hit.published,
+        # Undated feed hits borrow the date read from the page's own metadata
+        published=hit.published or scraped_date,
         scraped_published_date=scraped_date,
     )
 
 
-def process_hits(hits: List[ArticleHit], limit: int, log_file: Path) -> List[VerifiedArticle]:
-    verified: List[VerifiedArticle] = []
-    
+def process_hits(
+    hits: List[ArticleHit], limit: int, log_file: Path, deadline: Optional[float] = None
+) -> List[VerifiedArticle]:
+    """Verify hits in parallel until *limit* succeed or the monotonic *deadline* passes.
+
+    Results come back in the hits' ranked order, not in network completion order.
+    """
+    verified: List[Tuple[int, VerifiedArticle]] = []
+    stop = threading.Event()
+
     # Parallelize verification to avoid 60s timeout
     # Max 10 threads is a good balance for Vercel
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit candidate tasks (fetch a bit more than limit to ensure we fill it)
-        candidates = hits[:limit * 3]
-        future_to_hit = {
-            executor.submit(_process_single_hit, hit, log_file): hit 
-            for hit in candidates
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=10)
+    try:
+        # Submit candidate tasks (fetch a bit more than limit to ensure we fill it).
+        # Streams overlap, so drop repeat URLs before paying for a fetch.
+        seen = set()
+        candidates = []
+        for hit in hits:
+            key = canonical_url(hit.url) if hit.url else ""
+            if key and key in seen:
+                continue
+            seen.add(key)
+            candidates.append(hit)
+            if len(candidates) >= limit * 3:
+                break
+        future_to_rank = {
+            executor.submit(_process_single_hit, hit, log_file, stop): rank
+            for rank, hit in enumerate(candidates)
         }
-        
-        for future in concurrent.futures.as_completed(future_to_hit):
-            try:
-                result = future.result()
-                if result:
-                    verified.append(result)
-                    
-                    # If we reached the limit, we can stop
-                    if len(verified) >= limit:
-                        break
-            except Exception as e:
-                # Log exception but don't crash
-                _log_skipped(f"exception_{type(e).__name__}", "", log_file)
-                
-    return verified[:limit]
+
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            for future in concurrent.futures.as_completed(future_to_rank, timeout=remaining):
+                try:
+                    result = future.result()
+                    if result:
+                        verified.append((future_to_rank[future], result))
+
+                        # If we reached the limit, we can stop
+                        if len(verified) >= limit:
+                            break
+                except Exception as e:
+                    # Log exception but don't crash
+                    _log_skipped(f"exception_{type(e).__name__}", "", log_file)
+        except concurrent.futures.TimeoutError:
+            # Out of time — go with what has been verified so far
+            _log_skipped(f"process_hits_deadline_verified={len(verified)}", "", log_file)
+    finally:
+        # Drop queued candidates and tell in-flight ones to bail out early
+        # instead of blocking on fetches whose results we no longer need
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    verified.sort(key=lambda pair: pair[0])
+    return [article for _, article in verified[:limit]]
 
 
 def process_section(key: str, days: int, max_per_stream: Optional[int] = None, lang: str = "en") -> List[SummaryItem]:
@@ -170,25 +332,22 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
 
     cfg = streams[key]
 
-    collectors: Dict[str, Callable[[SectionConfig], List[ArticleHit]]] = {
-        "trending": lambda c: collect_trending(c.days or days),
-        "events": lambda c: collect_events(c.days or days),
-        "research_plain": lambda c: collect_research(c.days or days),
-        "ai_progress": lambda c: collect_ai_progress(c.days or days),
-        "canadian": lambda c: collect_canadian(c.days or days),
-        "global": lambda c: collect_global(c.days or days),
-        "deep_dive": lambda c: collect_deep_dive(c.days or days),
-    }
-
     log_file = settings.project_root / "logs" / f"run-{date.today().isoformat()}.jsonl"
 
     # Retry loop: Standard -> Expanded Window -> Relaxed Threshold
     # Attempt 0: Standard (days=7, thresh=default)
     # Vercel Optimization: Originally limited to 1 attempt to avoid 60s timeout.
-    # We are restoring it to 3 to ensure sections populate when standard search yields 0 hits.
+    # Retries now run only while the section is inside its time budget, so fast
+    # sections still get the expanded window / relaxed threshold.
     max_attempts = 3
-    
+    t0 = time.monotonic()
+    deadline = t0 + _SECTION_BUDGET_SECONDS
+
     for attempt in range(max_attempts):
+        if attempt > 0 and time.monotonic() - t0 >= _SECTION_BUDGET_SECONDS * 0.5:
+            _log_skipped(f"section_{key}_retry_skipped_budget", "", log_file)
+            break
+
         # Calculate dynamic settings for this attempt
         multiplier = 1 + attempt  # 1, 2, 3
         current_days = (cfg.days or days) * multiplier
@@ -202,26 +361,19 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
         run_cfg = replace(cfg, days=current_days, relevance_threshold=current_threshold)
 
         # 1. Collection
-        if key in collectors:
-            hits = collectors[key](run_cfg)
+        collector = _COLLECTORS.get(key)
+        if collector is not None:
+            hits = collector(run_cfg, days)
         else:
             hits = search_stream(run_cfg, current_days)
 
-        # Apply section-level curation pipeline:
-        hits = _filter_by_keywords(hits, run_cfg.reject_keywords)
-        hits = _boost_by_keywords(hits, run_cfg.boost_keywords)
-        
-        # 2b. Boost by historical source quality (SourceTracker)
-        hits = _boost_by_source_quality(hits)
-
-        # 2. Source priority (curated feeds first)
-        hits = _sort_by_source_priority(hits)
-        # 3. Time-decay (fresher articles rank higher within window)
-        hits = _apply_time_decay(hits, current_days)
+        # Apply section-level curation pipeline in one pass: reject/boost keywords,
+        # historical source quality, source priority, then time-decay
+        hits = _rank_hits(hits, run_cfg, current_days)
 
         _log_skipped(f"section_{key}_attempt_{attempt}_hits={len(hits)}", "", log_file)
 
-        verified = process_hits(hits, run_cfg.limit * 2, log_file)
+        verified = process_hits(hits, run_cfg.limit * 2, log_file, deadline=deadline)
         verified = deduplicate(verified)
         verified = _filter_verified_articles_by_date(verified, current_days)
 
@@ -237,10 +389,10 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
             relevance_threshold=run_cfg.relevance_threshold,
         )
 
-        # Filter by date window (LLM hallucination check)
-        items = _filter_items_by_date(items, current_days)
-        
-        final_items = [item for item in items if item.Live_Link]
+        # Filter by date window (LLM hallucination check) and drop link-less items in one pass
+        final_items = [
+            item for item in _iter_filtered_by_date(items, current_days) if item.Live_Link
+        ]
         
         if final_items:
             # Success! Record success metric?
@@ -248,10 +400,11 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
                 print(f"  [OK] {key} populated on retry #{attempt} (days={current_days}, thresh={current_threshold})")
             
             # Record source quality
-            tracker = SourceTracker()
-            for item in final_items:
-                if item.Live_Link and item.Relevance:
-                    tracker.record(item.Live_Link, item.Relevance)
+            get_tracker().record_many(
+                (item.Live_Link, item.Relevance)
+                for item in final_items
+                if item.Live_Link and item.Relevance
+            )
             
             return final_items
             
@@ -260,70 +413,106 @@ def process_section(key: str, days: int, max_per_stream: Optional[int] = None, l
     return [] # Failed all attempts
 
 
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})")
+
+
+def _iso_date(value: str) -> Optional[date]:
+    """Fast path for the dominant ``YYYY-MM-DD...`` shape; ``None`` if it doesn't match."""
+    m = _ISO_DATE_RE.match(value)
+    if not m:
+        return None
+    try:
+        return date(int(m[1]), int(m[2]), int(m[3]))
+    except ValueError:
+        return None
+
+
 def _filter_verified_articles_by_date(articles: List[VerifiedArticle], days: int) -> List[VerifiedArticle]:
     """Remove articles where the scraped date is definitely older than the search window."""
-    cutoff = datetime.utcnow() - timedelta(days=days)
     # Allow a small buffer (e.g. 24h) for timezone differences or late scraping
-    cutoff -= timedelta(days=1)
-    
+    cutoff = (datetime.utcnow() - timedelta(days=days + 1)).date()
+
     kept = []
     for a in articles:
         if not a.scraped_published_date:
             kept.append(a)
             continue
-            
-        # Try to parse the scraped date
-        # It could be ISO, or other formats. We'll try a few common ones.
-        try:
-            # Most meta tags are ISO-like
-            d_str = a.scraped_published_date[:19] # Truncate potential timezone for simple parsing
-            # Try ISO format first
-            pub = None
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S"):
+
+        # Meta tags are ISO-like; anything unparseable is kept (be permissive)
+        pub = _iso_date(a.scraped_published_date)
+        if pub and pub < cutoff:
+            # Definitely old
+            continue
+
+        kept.append(a)
+
+    return kept
+
+
+# Shape → candidate strptime formats for the common LLM date styles, so each
+# value is tried only against formats it can actually match
+_ITEM_DATE_FORMATS = (
+    (re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$"), ("%Y-%m-%d",)),
+    (re.compile(r"^[A-Za-z]+\s+\d{1,2},\s+\d{4}$"), ("%B %d, %Y", "%b %d, %Y")),
+    (re.compile(r"^\d{1,2}\s+[A-Za-z]+\s+\d{4}$"), ("%d %B %Y", "%d %b %Y")),
+)
+
+
+def _parse_item_date(value: str) -> Optional[date]:
+    """Parse an LLM-written date; ISO without strptime, others via the shape table."""
+    if len(value) == 10:
+        parsed = _iso_date(value)
+        if parsed is not None:
+            return parsed
+    for pattern, formats in _ITEM_DATE_FORMATS:
+        if pattern.match(value):
+            for fmt in formats:
                 try:
-                    pub = datetime.strptime(d_str, fmt)
-                    break
+                    return datetime.strptime(value, fmt).date()
                 except ValueError:
                     continue
-            
-            if pub and pub < cutoff:
-                # Definitely old
-                continue
-        except Exception:
-            # If parsing fails, be permissive and keep it
-            pass
-            
-        kept.append(a)
-        
-    return kept
+            return None
+    return None
 
 
-def _filter_items_by_date(items: List[SummaryItem], days: int) -> List[SummaryItem]:
-    """Remove SummaryItems whose LLM-generated Date is older than the window."""
+def _iter_filtered_by_date(items: Iterable[SummaryItem], days: int) -> Iterator[SummaryItem]:
+    """Yield SummaryItems whose LLM-generated Date is inside the window (or missing)."""
     cutoff = date.today() - timedelta(days=days)
-    filtered = []
     for item in items:
         if not item.Date:
             # No date on item — keep it (date wasn't available)
-            filtered.append(item)
+            yield item
             continue
-        try:
-            # Try parsing common LLM date formats
-            d = item.Date.strip()
-            parsed = None
-            for fmt in ("%Y-%m-%d", "%B %d, %Y", "%b %d, %Y", "%d %B %Y", "%d %b %Y"):
-                try:
-                    parsed = datetime.strptime(d, fmt).date()
-                    break
-                except ValueError:
-                    continue
-            if parsed and parsed < cutoff:
-                # Date is too old — skip this item
-                continue
-        except Exception:
-            pass
-        filtered.append(item)
-    return filtered
+        parsed = _parse_item_date(item.Date.strip())
+        if parsed and parsed < cutoff:
+            # Date is too old — skip this item
+            continue
+        yield item
+
+
+def _filter_items_by_date(items: List[SummaryItem], days: int) -> List[SummaryItem]:
+    """Remove SummaryItems whose LLM-generated Date is older than the window."""
+    return list(_iter_filtered_by_date(items, days))
+
+
+def _process_section_in_worker(*args) -> List[SummaryItem]:
+    """process_section for pool processes, which exit without running atexit hooks."""
+    try:
+        return process_section(*args)
+    finally:
+        _stop_log_writer()
+        feed_cache.save()
+
+
+def _top_items(results: Dict[str, List[SummaryItem]], k: int = 6) -> List[SummaryItem]:
+    """Highest-relevance items across sections (ties keep SECTION_ORDER order)."""
+    all_items = (item for key in SECTION_ORDER for item in results.get(key, []))
+    # Same result as sorted(..., reverse=True)[:k] (ties stay in order) without a full sort
+    return heapq.nlargest(k, all_items, key=_relevance)
+
+
+def _relevance(item: SummaryItem) -> int:
+    return item.Relevance if item.Relevance is not None else 0
 
 
 @click.command()
@@ -332,20 +521,39 @@ def _filter_items_by_date(items: List[SummaryItem], days: int) -> List[SummaryIt
 @click.option("--max-per-stream", default=None, type=int, help="Override max items per stream.")
 @click.option("--dry-run", is_flag=True, default=False, help="Write HTML only, skip Outlook.")
 @click.option("--lang", default="en", type=click.Choice(["en", "fr"]), help="Output language.")
-@click.option("--workers", default=4, type=int, help="Number of parallel workers.")
-def main(since_days, run_date, max_per_stream, dry_run, lang, workers):
+@click.option("--workers", default=len(SECTION_ORDER), type=int, help="Number of parallel workers.")
+@click.option("--processes", is_flag=True, default=False, help="Run each section in its own process.")
+def main(since_days, run_date, max_per_stream, dry_run, lang, workers, processes):
     settings = get_settings()
     days = since_days or settings.run_days
+    # Sections are independent and I/O-bound, so one thread each; more would sit idle
+    workers = max(1, min(workers, len(SECTION_ORDER)))
 
     sections: Dict[str, List[SummaryItem]] = OrderedDict()
     
-    click.echo(f"Starting generation with {workers} workers...")
-
-    # Use ThreadPoolExecutor for parallel section processing
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+    click.echo(f"Starting generation with {workers} {'processes' if processes else 'workers'}...")
+
+    # Use ThreadPoolExecutor for parallel section processing. Every stage is
+    # network-bound (feeds, page fetches, Gemini calls); the only local CPU work is
+    # HTML parsing and a small JSON decode, so the GIL is released most of the time
+    # and a process pool would only add pickling and start-up cost.
+    # --processes opts into one process per section for parse-heavy runs; each
+    # worker then keeps its own HTTP session and verify cache.
+    pool_cls = (
+        concurrent.futures.ProcessPoolExecutor if processes
+        else concurrent.futures.ThreadPoolExecutor
+    )
+    # The TL;DR is started speculatively while the last section is still running;
+    # it only has to be regenerated if that section changes the top items.
+    tldr_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    speculative = None
+    with pool_cls(max_workers=workers) as executor:
         # Submit all tasks
         future_to_section = {
-            executor.submit(process_section, key, days, max_per_stream, lang): key
+            executor.submit(
+                _process_section_in_worker if processes else process_section,
+                key, days, max_per_stream, lang,
+            ): key
             for key in SECTION_ORDER
         }
         
@@ -364,15 +572,23 @@ def main(since_days, run_date, max_per_stream, dry_run, lang, workers):
                 click.echo(f"  [ERROR] {key} generated an exception: {exc}")
                 results[key] = []
 
+            if speculative is None and len(results) == len(SECTION_ORDER) - 1:
+                top = _top_items(results)
+                if top:
+                    speculative = (top, tldr_executor.submit(generate_tldr, top, lang=lang))
+
     # Reassemble in correct order
     for key in SECTION_ORDER:
         sections[key] = results.get(key, [])
 
     # Generate TL;DR from the top-relevance items across all sections
     click.echo("  -> generating TL;DR...")
-    all_items = [item for items in sections.values() for item in items]
-    all_items.sort(key=lambda x: x.Relevance or 0, reverse=True)
-    tldr = generate_tldr(all_items[:6], lang=lang)
+    top = _top_items(sections)
+    if speculative is not None and speculative[0] == top:
+        tldr = speculative[1].result()
+    else:
+        tldr = generate_tldr(top, lang=lang)
+    tldr_executor.shutdown(wait=False, cancel_futures=True)
 
     html = render_newsletter(sections, run_date=run_date or date.today().isoformat(), tldr=tldr, lang=lang)
 
@@ -1,31 +1,60 @@
 import re
-from typing import Optional
+from typing import Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .verify import DEFAULT_HEADERS
+from .verify import FETCH_TIMEOUT, HTML_PARSER, SESSION, Timeout, host_slot, read_capped, verify_link
+
+# Keep it reasonably bounded for LLM cost
+_MAX_CONTENT_CHARS = 20_000
+
+# The only tags extract_metadata looks at — everything else is skipped while parsing
+_METADATA_TAGS = SoupStrainer(["meta", "script", "time"])
+
+_WS_BEFORE_NEWLINE_RE = re.compile(r"\s+\n")
+
+_NON_CONTENT_TAGS = ["script", "style", "noscript", "header", "footer", "aside", "nav"]
+
+# A lone <article>/<main> with at least this much text is taken as the story body,
+# dropping related-links rails, cookie banners and other page chrome around it
+_MIN_BODY_CHARS = 500
 
 
 def extract_text(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript", "header", "footer", "aside"]):
-        tag.decompose()
-    text = soup.get_text(separator="\n")
-    # Collapse whitespace
-    text = re.sub(r"\s+\n", "\n", text)
-    text = re.sub(r"\n{2,}", "\n\n", text)
-    return text.strip()
+    return _text_from_soup(BeautifulSoup(html, HTML_PARSER))
+
 
+def _text_from_soup(soup: BeautifulSoup) -> str:
+    """Visible article text. Mutates *soup* (drops script/chrome tags)."""
+    # extract() just detaches the subtree; decompose() would also walk it to
+    # tear it down, which is wasted work since the soup is discarded afterwards
+    for tag in soup.find_all(_NON_CONTENT_TAGS):
+        tag.extract()
+    for name in ("article", "main"):
+        nodes = soup.find_all(name, limit=2)
+        if len(nodes) == 1:
+            body = _collapse(nodes[0].get_text(separator="\n"))
+            if len(body) >= _MIN_BODY_CHARS:
+                return body
+    return _collapse(soup.get_text(separator="\n"))
 
-def fetch_article(url: str, timeout: int = 10) -> Optional[str]:
+
+def _collapse(text: str) -> str:
+    # Collapse whitespace. Any run ending in a newline becomes one newline, so a
+    # separate \n{2,} pass could never match anything — one scan is enough.
+    return _WS_BEFORE_NEWLINE_RE.sub("\n", text).strip()
+
+
+def fetch_article(url: str, timeout: Timeout = FETCH_TIMEOUT) -> Optional[str]:
     try:
-        resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
-        if resp.status_code != 200:
-            return None
-        if "text/html" not in resp.headers.get("Content-Type", ""):
-            return None
-        return resp.text
+        with host_slot(url):
+            with SESSION.get(url, timeout=timeout, stream=True) as resp:
+                if resp.status_code != 200:
+                    return None
+                if "text/html" not in resp.headers.get("Content-Type", ""):
+                    return None
+                return read_capped(resp)
     except requests.RequestException:
         return None
 
@@ -36,41 +65,91 @@ def scrape(url: str, html: Optional[str] = None) -> Optional[str]:
     if not html:
         return None
     text = extract_text(html)
-    # Keep it reasonably bounded for LLM cost
-    return text[:20_000]
+    return text[:_MAX_CONTENT_CHARS]
+
+
+def fetch_and_extract(url: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Verify *url* and pull both body text and published date from one parse.
+
+    Returns ``(html, content, scraped_date)``; ``html`` is ``None`` when the link
+    fails verification, ``content`` is ``None`` when no text could be extracted
+    (including pages the parser fails on).
+    """
+    html = verify_link(url)
+    if html is None:
+        return None, None, None
+    try:
+        content, meta = parse_article(html)
+    except Exception:
+        # The page verified but the parsers choke on it — callers fall back to the snippet
+        return html, None, None
+    return html, content or None, meta.get("date")
+
+
+def parse_article(html: str) -> Tuple[str, dict]:
+    """Body text (bounded like scrape()) and metadata from a single parse."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    # Metadata first: JSON-LD lives in <script> tags that text extraction drops
+    meta = _metadata_from_soup(soup)
+    return _text_from_soup(soup)[:_MAX_CONTENT_CHARS], meta
 
 
 def extract_metadata(html: str) -> dict:
     """Extract metadata (published date, etc.) from HTML."""
-    soup = BeautifulSoup(html, "html.parser")
+    return _metadata_from_soup(BeautifulSoup(html, HTML_PARSER, parse_only=_METADATA_TAGS))
+
+
+# Meta tags carrying a publish date, in priority order: (attribute, value)
+_DATE_META_KEYS = (
+    ("property", "article:published_time"),
+    ("name", "pubdate"),
+    ("name", "date"),
+    ("name", "DC.date.issued"),
+    ("name", "sailthru.date"),
+)
+_DATE_META_SET = frozenset(_DATE_META_KEYS)
+_DATE_PUBLISHED_RE = re.compile(r'"datePublished"\s*:\s*"([^"]+)"')
+
+
+def _metadata_from_soup(soup: BeautifulSoup) -> dict:
     meta = {}
 
+    # One walk collects every candidate: the first <meta> per date key, JSON-LD
+    # blocks in document order and the first <time> tag
+    meta_content: dict = {}
+    ld_scripts = []
+    time_tag = None
+    for tag in soup.find_all(["meta", "script", "time"]):
+        if tag.name == "meta":
+            for attr in ("property", "name"):
+                key = (attr, tag.get(attr))
+                if key in _DATE_META_SET and key not in meta_content:
+                    meta_content[key] = tag.get("content")
+        elif tag.name == "script":
+            if tag.get("type") == "application/ld+json":
+                ld_scripts.append(tag)
+        elif time_tag is None:
+            time_tag = tag
+
     # 1. Try standard meta tags
     # <meta property="article:published_time" content="...">
     # <meta name="pubdate" content="...">
     # <meta name="date" content="...">
-    for selector in [
-        {"property": "article:published_time"},
-        {"name": "pubdate"},
-        {"name": "date"},
-        {"name": "DC.date.issued"},
-        {"name": "sailthru.date"},
-    ]:
-        tag = soup.find("meta", attrs=selector)
-        if tag and tag.get("content"):
-            meta["date"] = tag["content"]
+    for key in _DATE_META_KEYS:
+        if meta_content.get(key):
+            meta["date"] = meta_content[key]
             break
 
     # 2. Try JSON-LD if no meta tag found
     if not meta.get("date"):
-        for script in soup.find_all("script", type="application/ld+json"):
+        for script in ld_scripts:
             try:
                 data = script.string
                 if not data:
                     continue
                 # simplistic approach: regex (safer than json.load on arbitrary web junk)
                 # look for "datePublished": "..."
-                match = re.search(r'"datePublished"\s*:\s*"([^"]+)"', data)
+                match = _DATE_PUBLISHED_RE.search(data)
                 if match:
                     meta["date"] = match.group(1)
                     break
@@ -79,7 +158,6 @@ def extract_metadata(html: str) -> dict:
 
     # 3. Try <time> tag
     if not meta.get("date"):
-        time_tag = soup.find("time")
         if time_tag:
             if time_tag.get("datetime"):
                 meta["date"] = time_tag["datetime"]
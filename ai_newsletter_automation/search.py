@@ -1,15 +1,25 @@
+import calendar
+import concurrent.futures
+import re
+import time
 from dataclasses import replace
+from email.utils import parsedate_to_datetime
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Iterable
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Iterable, Tuple
 
 import requests
 import feedparser
-from urllib.parse import urlparse, urlunparse, parse_qs, unquote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, parse_qs, unquote
 from duckduckgo_search import DDGS
 
+from . import fast_feed, feed_cache
 from .config import get_settings
 from .models import ArticleHit, SectionConfig
-from .source_quality import SourceTracker
+from .source_quality import get_tracker
+from .verify import TTLCache
 
 
 # ── Domain blocklist — evergreen / non-news pages that pollute results ──
@@ -98,40 +108,76 @@ DEFAULT_STREAMS: Dict[str, SectionConfig] = {
 # ── Helpers ──
 
 
+def _cutoff_ts(days: int) -> float:
+    """Epoch seconds *days* ago — compared directly against feed struct_times via timegm."""
+    return time.time() - days * 86400
+
+
 def _since_timestamp(days: int) -> str:
     cutoff = datetime.utcnow() - timedelta(days=days)
     return cutoff.strftime("%Y-%m-%d")
 
 
+# Normalised once here so the per-URL checks need no .lower() copies:
+# urlparse already lowercases hostnames, and paths are matched case-insensitively
+_BLOCKED_DOMAIN_SET = frozenset(d.lower() for d in BLOCKED_DOMAINS)
+_BLOCKED_PATH_RE = re.compile("|".join(map(re.escape, BLOCKED_URL_PATTERNS)), re.IGNORECASE)
+
+
+def _domain_in(hostname: str, domains: frozenset) -> bool:
+    """True if lowercase *hostname* or any parent domain of it is in *domains*.
+
+    One set probe per label instead of an endswith per listed domain; matching
+    whole labels also stops e.g. "notmedium.com" from hitting "medium.com".
+    """
+    labels = hostname.split(".")
+    return any(".".join(labels[i:]) in domains for i in range(len(labels)))
+
+
+# The same URLs pass through feed filtering, ranking and dedup several times;
+# both helpers are pure, so each distinct URL is parsed once
+@lru_cache(maxsize=4096)
 def _is_blocked_url(url: str) -> bool:
     """Return True if the URL belongs to a blocked domain or matches a blocked pattern."""
     try:
         parsed = urlparse(url)
-        domain = parsed.hostname or ""
-        if any(domain.endswith(b) for b in BLOCKED_DOMAINS):
+        if _domain_in(parsed.hostname or "", _BLOCKED_DOMAIN_SET):
             return True
-        path = parsed.path.lower()
-        if any(p in path for p in BLOCKED_URL_PATTERNS):
+        if _BLOCKED_PATH_RE.search(parsed.path):
             return True
     except Exception:
         pass
     return False
 
 
-def _normalize_url(url: str) -> str:
+@lru_cache(maxsize=4096)
+def _hostname(url: str) -> str:
+    """Lowercase hostname of *url* ("" if none), parsed once per distinct URL."""
     try:
-        parsed = urlparse(url)
-        cleaned = parsed._replace(query="", fragment="")
-        return urlunparse(cleaned)
-    except Exception:
-        return url
+        return urlparse(url).hostname or ""
+    except ValueError:
+        return ""
+
+
+def _normalize_url(url: str) -> str:
+    """*url* without its query string and fragment."""
+    # Same split urlparse makes (fragment first, then query), without the
+    # urlparse/urlunparse round trip
+    return url.partition("#")[0].partition("?")[0]
+
+
+@lru_cache(maxsize=4096)
+def _dedupe_key(url: str, title: str) -> Tuple[str, str]:
+    # Hits are re-deduped by every collector they pass through, so the
+    # normalised key is computed once per (url, title)
+    return _normalize_url(url).lower(), title.strip().lower()
 
 
 def _dedupe(hits: List[ArticleHit]) -> List[ArticleHit]:
     seen = set()
     unique = []
     for h in hits:
-        key = (_normalize_url(h.url).lower(), h.title.strip().lower())
+        key = _dedupe_key(h.url, h.title)
         if key in seen:
             continue
         seen.add(key)
@@ -139,21 +185,30 @@ def _dedupe(hits: List[ArticleHit]) -> List[ArticleHit]:
     return unique
 
 
+@lru_cache(maxsize=2048)
 def _parse_date_str(date_str: Optional[str]) -> Optional[datetime]:
-    """Best-effort parse of a date string into a datetime object."""
-    if not date_str:
+    """Best-effort parse of a date string into a naive UTC datetime.
+
+    ISO 8601 and RFC 2822 (what feeds emit) are parsed directly rather than by
+    trying strptime formats until one stops raising.
+    """
+    if not date_str or not isinstance(date_str, str):
         return None
-    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%a, %d %b %Y %H:%M:%S %z",
-                "%a, %d %b %Y %H:%M:%S", "%Y-%m-%dT%H:%M:%S%z",
-                "%Y-%m-%dT%H:%M:%SZ"):
+    s = date_str.strip()
+    try:
+        # fromisoformat only learnt the "Z" suffix in 3.11
+        dt = datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+    except ValueError:
         try:
-            dt = datetime.strptime(date_str.strip()[:25], fmt)
-            if dt.tzinfo is not None:
-                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
-            return dt
-        except (ValueError, AttributeError):
-            continue
-    return None
+            dt = parsedate_to_datetime(s)
+        except (TypeError, ValueError):
+            try:
+                dt = datetime.strptime(s, "%Y-%m-%d")  # unpadded, e.g. 2026-1-5
+            except ValueError:
+                return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
 
 
 # Sources whose articles are trusted enough to keep even without a date.
@@ -183,25 +238,40 @@ def _filter_by_date(hits: List[ArticleHit], days: int) -> List[ArticleHit]:
 def _filter_blocked(hits: List[ArticleHit], extra_excludes: Optional[Iterable[str]] = None) -> List[ArticleHit]:
     """Remove hits from blocked domains or URL patterns.
     Optionally applies section-level exclude_domains on top of the global blocklist."""
-    filtered = [h for h in hits if not _is_blocked_url(h.url)]
-    if extra_excludes:
-        exclude_set = {d.lower() for d in extra_excludes}
-        filtered = [
-            h for h in filtered
-            if not any((urlparse(h.url).hostname or "").endswith(d) for d in exclude_set)
-        ]
-    return filtered
+    excludes = frozenset(d.lower() for d in extra_excludes or ())
+    return [
+        h for h in hits
+        if not _is_blocked_url(h.url) and not (excludes and _domain_in(_hostname(h.url), excludes))
+    ]
+
+
+@lru_cache(maxsize=64)
+def _keyword_regex(keywords: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """One compiled alternation over already-lowercased *keywords*, None if empty."""
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def _count_keywords(text: str, keywords: Tuple[str, ...]) -> int:
+    """Number of distinct *keywords* found in *text* (both lowercase)."""
+    pattern = _keyword_regex(keywords)
+    # Most texts match nothing; the regex settles that in a single scan.
+    # Keywords can overlap ("ai" in "openai"), so hits are still counted per keyword.
+    if pattern is None or not pattern.search(text):
+        return 0
+    return sum(1 for k in keywords if k in text)
 
 
 def _filter_by_keywords(hits: List[ArticleHit], reject_keywords: Optional[List[str]]) -> List[ArticleHit]:
     """Remove hits whose title or snippet contains any reject keyword (case-insensitive)."""
     if not reject_keywords:
         return hits
-    reject_lower = [k.lower() for k in reject_keywords]
+    reject_re = _keyword_regex(tuple(k.lower() for k in reject_keywords))
     filtered = []
     for h in hits:
         text = f"{h.title} {h.snippet}".lower()
-        if any(k in text for k in reject_lower):
+        if reject_re.search(text):
             continue
         filtered.append(h)
     return filtered
@@ -211,11 +281,10 @@ def _boost_by_keywords(hits: List[ArticleHit], boost_keywords: Optional[List[str
     """Stable-sort hits so articles containing boost keywords appear first."""
     if not boost_keywords:
         return hits
-    boost_lower = [k.lower() for k in boost_keywords]
+    boost_lower = tuple(k.lower() for k in boost_keywords)
 
     def score(h: ArticleHit) -> int:
-        text = f"{h.title} {h.snippet}".lower()
-        return sum(1 for k in boost_lower if k in text)
+        return _count_keywords(f"{h.title} {h.snippet}".lower(), boost_lower)
 
     return sorted(hits, key=score, reverse=True)
 
@@ -225,17 +294,11 @@ def _boost_by_source_quality(hits: List[ArticleHit]) -> List[ArticleHit]:
     
     Uses SourceTracker to get a quality boost (0.0-1.0) for each domain.
     """
-    tracker = SourceTracker()
-    
-    # Cache boosts to avoid repeated disk reads if SourceTracker wasn't cached
-    # (SourceTracker implementation reads JSON on every record/get_boost call in current form,
-    # but for a batch sort we can just call it. Optimization: SourceTracker could cache data)
-    
-    def score(h: ArticleHit) -> float:
-        return tracker.get_boost(h.url)
-        
+    # One read of the history files for the whole batch
+    boosts = get_tracker().get_boosts(h.url for h in hits)
+
     # Stable sort: high boost first
-    return sorted(hits, key=score, reverse=True)
+    return sorted(hits, key=lambda h: boosts[h.url], reverse=True)
 
 
 # Source priority for sorting — lower number = higher priority.
@@ -271,17 +334,85 @@ def _apply_time_decay(hits: List[ArticleHit], days: int) -> List[ArticleHit]:
         pub = _parse_date_str(h.published)
         if pub is None:
             return 0.5  # neutral — don't penalize or reward undated articles
-        
-        # Ensure naive UTC for comparison
-        if pub.tzinfo is not None:
-            pub = pub.astimezone(timezone.utc).replace(tzinfo=None)
-            
+        # _parse_date_str already returns naive UTC
         age_days = (now - pub).total_seconds() / 86400
         return max(0.0, 1.0 - (age_days / days))
 
     return sorted(hits, key=freshness, reverse=True)
 
 
+def _rank_hits(hits: List[ArticleHit], cfg: SectionConfig, days: int) -> List[ArticleHit]:
+    """Reject, boost and order hits in one pass with a single sort.
+
+    Equivalent to running _filter_by_keywords, _boost_by_keywords,
+    _boost_by_source_quality, _sort_by_source_priority and _apply_time_decay
+    in sequence: the chained stable sorts reduce to one lexicographic key
+    (freshness, source priority, source quality, keyword hits).
+    """
+    reject_re = _keyword_regex(tuple(k.lower() for k in cfg.reject_keywords or ()))
+    boost_lower = tuple(k.lower() for k in cfg.boost_keywords or ())
+    quality = get_tracker().get_boosts(h.url for h in hits)
+    now = datetime.utcnow()
+
+    keyed = []
+    for h in hits:
+        text = f"{h.title} {h.snippet}".lower() if reject_re or boost_lower else ""
+        if reject_re and reject_re.search(text):
+            continue
+
+        kw = _count_keywords(text, boost_lower)
+
+        priority = _SOURCE_PRIORITY.get(h.source or "", _DEFAULT_SOURCE_PRIORITY)
+
+        fresh = 0.0
+        if days > 0:
+            pub = _parse_date_str(h.published)
+            if pub is None:
+                fresh = 0.5
+            else:
+                age_days = (now - pub).total_seconds() / 86400
+                fresh = max(0.0, 1.0 - (age_days / days))
+
+        keyed.append(((-fresh, priority, -quality[h.url], -kw), h))
+
+    keyed.sort(key=lambda pair: pair[0])
+    return [h for _, h in keyed]
+
+
+def _post_filter(hits: List[ArticleHit], cfg: SectionConfig, days: int) -> List[ArticleHit]:
+    """Blocklist, date window and keyword filtering/boosting in one pass.
+
+    Equivalent to _filter_blocked, _filter_by_date, _filter_by_keywords and
+    _boost_by_keywords in sequence, without the intermediate lists.
+    """
+    excludes = frozenset(d.lower() for d in cfg.exclude_domains or ())
+    reject_re = _keyword_regex(tuple(k.lower() for k in cfg.reject_keywords or ()))
+    boost_lower = tuple(k.lower() for k in cfg.boost_keywords or ())
+    cutoff = datetime.utcnow() - timedelta(days=days)
+
+    keyed = []
+    for h in hits:
+        if _is_blocked_url(h.url):
+            continue
+        if excludes and _domain_in(_hostname(h.url), excludes):
+            continue
+        pub = _parse_date_str(h.published)
+        if pub is None:
+            # No date — allow through only if from a trusted source
+            if not (h.source and h.source in _TRUSTED_SOURCES):
+                continue
+        elif pub < cutoff:
+            continue
+        text = f"{h.title} {h.snippet}".lower() if reject_re or boost_lower else ""
+        if reject_re and reject_re.search(text):
+            continue
+        keyed.append((-_count_keywords(text, boost_lower), h))
+
+    if boost_lower:
+        keyed.sort(key=lambda pair: pair[0])
+    return [h for _, h in keyed]
+
+
 # ── Tavily search ──
 
 
@@ -301,7 +432,8 @@ def search_stream(section: SectionConfig, days: int) -> List[ArticleHit]:
     hits: List[ArticleHit] = []
 
     try:
-        resp = requests.post("https://api.tavily.com/search", json=payload, timeout=20)
+        # Sections query Tavily concurrently; the shared pool keeps their TLS connections warm
+        resp = _HTTP.post("https://api.tavily.com/search", json=payload, timeout=20)
         resp.raise_for_status()
         data = resp.json()
         
@@ -342,13 +474,119 @@ def search_stream(section: SectionConfig, days: int) -> List[ArticleHit]:
     except Exception as e:
         print(f"  [ERROR] Request failed for {section.name}: {e}")
 
-    # Post-filter: date + blocked domains (global + section-level excludes)
-    hits = _filter_blocked(hits, extra_excludes=section.exclude_domains)
-    hits = _filter_by_date(hits, days)
-    # Apply section-level keyword filtering and boosting
-    hits = _filter_by_keywords(hits, section.reject_keywords)
-    hits = _boost_by_keywords(hits, section.boost_keywords)
-    return hits
+    # Post-filter: blocked domains (global + section-level excludes), date,
+    # then section-level keyword filtering and boosting
+    return _post_filter(hits, section, days)
+
+
+# ── Feed fetching ──
+
+# One pooled session for Tavily, the HN API and RSS feeds so repeat requests
+# reuse warm TLS connections (requests already negotiates gzip). Idempotent
+# GETs that fail to connect or get a 429/5xx are retried quickly; read timeouts
+# are not, so a silent host costs one timeout rather than three.
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        connect=1,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(("GET", "HEAD")),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    ),
+)
+_HTTP.mount("https://", _HTTP_ADAPTER)
+_HTTP.mount("http://", _HTTP_ADAPTER)
+
+_FEED_TIMEOUT = 10
+_FEED_WORKERS = 8
+
+# Parsed feeds for the current run: section retries re-run their collectors,
+# and should not download and parse the same feeds again
+_FEED_MEMO = TTLCache(max_items=64)
+_FEED_MEMO_TTL = 600
+
+
+def _fetch_feed(url: str) -> feedparser.FeedParserDict:
+    """Download *url* on the shared session and parse it; empty feed on any failure."""
+    return _download_feed(url)
+
+
+def _fetch_feeds(urls: List[str]) -> List[feedparser.FeedParserDict]:
+    """Fetch several feeds concurrently; results line up with *urls*."""
+    if len(urls) <= 1:
+        return [_fetch_feed(url) for url in urls]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_FEED_WORKERS, len(urls))) as executor:
+        return list(executor.map(_download_feed, urls))
+
+
+def _download_feed(url: str) -> feedparser.FeedParserDict:
+    hit, feed = _FEED_MEMO.get(url)
+    if hit:
+        return feed
+    feed = _download_feed_uncached(url)
+    # Failures are not remembered, so a retry gets another chance
+    if feed.entries:
+        _FEED_MEMO.set(url, feed, _FEED_MEMO_TTL)
+    return feed
+
+
+def _download_feed_uncached(url: str) -> feedparser.FeedParserDict:
+    try:
+        # Conditional GET: an unchanged feed costs a 304 and no XML parsing
+        headers = {"User-Agent": feedparser.USER_AGENT, **feed_cache.validators(url)}
+        resp = _HTTP.get(url, timeout=_FEED_TIMEOUT, headers=headers)
+        if resp.status_code == 304:
+            cached = feed_cache.entries(url)
+            if cached is not None:
+                return feedparser.FeedParserDict(entries=[feedparser.FeedParserDict(e) for e in cached])
+        if resp.status_code >= 400:
+            return feedparser.FeedParserDict(entries=[])
+        feed = _parse_feed(resp)
+        feed_cache.store(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), feed.entries)
+        return feed
+    except Exception:
+        return feedparser.FeedParserDict(entries=[])
+
+
+def _parse_feed(resp: requests.Response) -> feedparser.FeedParserDict:
+    """Parse a feed response, via the lxml extractor when it yields entries."""
+    entries = fast_feed.parse(resp.content, base_url=resp.url)
+    if entries:
+        for entry in entries:
+            for key in ("published", "updated"):
+                dt = _parse_date_str(entry.get(key))
+                entry[f"{key}_parsed"] = dt.timetuple() if dt else None
+        return feedparser.FeedParserDict(entries=[feedparser.FeedParserDict(e) for e in entries])
+    # Unusual formats: hand over the headers feedparser would have seen itself,
+    # for charset detection and resolving relative links
+    return feedparser.parse(
+        resp.content,
+        response_headers={
+            "content-type": resp.headers.get("Content-Type", ""),
+            "content-location": resp.url,
+        },
+    )
+
+
+def _gather(*fetchers: Callable[[], List[ArticleHit]]) -> List[ArticleHit]:
+    """Run independent hit sources concurrently; hits come back in argument order."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = [executor.submit(fetch) for fetch in fetchers]
+        return [hit for future in futures for hit in future.result()]
+
+
+def _or_empty(fetch: Callable[..., List[ArticleHit]], *args) -> List[ArticleHit]:
+    """Call *fetch*, treating any failure as "no hits" (for best-effort sources)."""
+    try:
+        return fetch(*args)
+    except Exception:
+        return []
 
 
 # ── Trending Collectors ──
@@ -356,48 +594,66 @@ def search_stream(section: SectionConfig, days: int) -> List[ArticleHit]:
 
 HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
 AI_KEYWORDS = ("ai", "artificial", "llm", "model", "gpt", "transformer", "openai", "anthropic", "gemini")
+# Same substring semantics as testing each keyword against the lowercased title,
+# in one case-insensitive scan
+_AI_KEYWORDS_RE = re.compile("|".join(map(re.escape, AI_KEYWORDS)), re.IGNORECASE)
+
+
+_HN_WORKERS = 16
+
+
+def _fetch_hn_item(story_id: int) -> Optional[dict]:
+    try:
+        return _HTTP.get(f"{HN_API_BASE}/item/{story_id}.json", timeout=5).json()
+    except Exception:
+        return None
 
 
 def fetch_hn_trending(limit: int = 30, days: int = 7) -> List[ArticleHit]:
-    cutoff_ts = (datetime.utcnow() - timedelta(days=days)).timestamp()
+    cutoff_ts = _cutoff_ts(days)
     try:
-        top_ids = requests.get(f"{HN_API_BASE}/topstories.json", timeout=10).json()[: limit * 2]
-        best_ids = requests.get(f"{HN_API_BASE}/beststories.json", timeout=10).json()[: limit]
+        top_ids = _HTTP.get(f"{HN_API_BASE}/topstories.json", timeout=10).json()[: limit * 2]
+        best_ids = _HTTP.get(f"{HN_API_BASE}/beststories.json", timeout=10).json()[: limit]
         ids = list(dict.fromkeys(top_ids + best_ids))
     except Exception:
         return []
 
     hits: List[ArticleHit] = []
-    for story_id in ids:
-        try:
-            item = requests.get(f"{HN_API_BASE}/item/{story_id}.json", timeout=5).json()
-            title = item.get("title", "")
-            if not title or not any(k in title.lower() for k in AI_KEYWORDS):
-                continue
-            # Date filter: reject items older than the search window
-            item_time = item.get("time", 0)
-            if item_time < cutoff_ts:
-                continue
-            url = item.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
-            if _is_blocked_url(url):
+    # Items are fetched concurrently but consumed in ranking order, so the
+    # result matches the old serial loop; leftover lookups are cancelled
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=_HN_WORKERS)
+    try:
+        for story_id, item in zip(ids, executor.map(_fetch_hn_item, ids)):
+            try:
+                title = item.get("title", "")
+                if not title or not _AI_KEYWORDS_RE.search(title):
+                    continue
+                # Date filter: reject items older than the search window
+                item_time = item.get("time", 0)
+                if item_time < cutoff_ts:
+                    continue
+                url = item.get("url") or f"https://news.ycombinator.com/item?id={story_id}"
+                if _is_blocked_url(url):
+                    continue
+                pub_dt = datetime.utcfromtimestamp(item_time)
+                hits.append(ArticleHit(
+                    title=title, url=url, snippet="Hacker News trending",
+                    published=pub_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+                ))
+                if len(hits) >= limit:
+                    break
+            except Exception:
                 continue
-            pub_dt = datetime.utcfromtimestamp(item_time)
-            hits.append(ArticleHit(
-                title=title, url=url, snippet="Hacker News trending",
-                published=pub_dt.strftime("%Y-%m-%dT%H:%M:%S"),
-            ))
-            if len(hits) >= limit:
-                break
-        except Exception:
-            continue
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     return hits
 
 
 def fetch_producthunt_trending(limit: int = 10, days: int = 7) -> List[ArticleHit]:
     rss_url = "https://www.producthunt.com/feeds/topic/artificial-intelligence"
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff_ts = _cutoff_ts(days)
     try:
-        feed = feedparser.parse(rss_url)
+        feed = _fetch_feed(rss_url)
     except Exception:
         return []
     hits: List[ArticleHit] = []
@@ -405,8 +661,7 @@ def fetch_producthunt_trending(limit: int = 10, days: int = 7) -> List[ArticleHi
         # Date filter
         published = entry.get("published_parsed") or entry.get("updated_parsed")
         if published:
-            pub_dt = datetime(*published[:6])
-            if pub_dt < cutoff:
+            if calendar.timegm(published) < cutoff_ts:
                 continue
         elif not published:
             # No date available — skip to avoid stale content
@@ -467,17 +722,12 @@ GOOGLE_ALERT_FEEDS: Dict[str, List[str]] = {
 
 def fetch_curated_feeds(limit: int = 10, days: int = 7) -> List[ArticleHit]:
     hits: List[ArticleHit] = []
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in CURATED_FEEDS:
-        try:
-            feed = feedparser.parse(url)
-        except Exception:
-            continue
+    cutoff_ts = _cutoff_ts(days)
+    for feed in _fetch_feeds(CURATED_FEEDS):
         for entry in feed.entries:
             published = entry.get("published_parsed") or entry.get("updated_parsed")
             if published:
-                pub_dt = datetime(*published[:6])
-                if pub_dt < cutoff:
+                if calendar.timegm(published) < cutoff_ts:
                     continue
             else:
                 # No date — skip to avoid stale content
@@ -522,17 +772,12 @@ def fetch_google_alerts(section_key: str, limit: int = 15, days: int = 7) -> Lis
     if not urls:
         return []
     hits: List[ArticleHit] = []
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in urls:
-        try:
-            feed = feedparser.parse(url)
-        except Exception:
-            continue
+    cutoff_ts = _cutoff_ts(days)
+    for feed in _fetch_feeds(urls):
         for entry in feed.entries:
             published = entry.get("published_parsed") or entry.get("updated_parsed")
             if published:
-                pub_dt = datetime(*published[:6])
-                if pub_dt < cutoff:
+                if calendar.timegm(published) < cutoff_ts:
                     continue
             else:
                 continue
@@ -555,14 +800,15 @@ def fetch_google_alerts(section_key: str, limit: int = 15, days: int = 7) -> Lis
 
 
 def collect_trending(days: int) -> List[ArticleHit]:
-    hits: List[ArticleHit] = []
-    hits.extend(fetch_google_alerts("trending", limit=10, days=days))
-    hits.extend(fetch_hn_trending(limit=20, days=days))
-    hits.extend(fetch_producthunt_trending(limit=10, days=days))
-    hits.extend(fetch_curated_feeds(limit=15, days=days))
     # Tavily fallback
     trending_cfg = SectionConfig(name="Trending AI", query='"AI" AND ("top news" OR trending) AND week', limit=8)
-    hits.extend(search_stream(trending_cfg, days))
+    hits = _gather(
+        lambda: fetch_google_alerts("trending", limit=10, days=days),
+        lambda: fetch_hn_trending(limit=20, days=days),
+        lambda: fetch_producthunt_trending(limit=10, days=days),
+        lambda: fetch_curated_feeds(limit=15, days=days),
+        lambda: search_stream(trending_cfg, days),
+    )
     return _dedupe(hits)
 
 
@@ -576,16 +822,16 @@ def collect_research(days: int) -> List[ArticleHit]:
     max_results = 25
     query = "cat:cs.AI+OR+cat:cs.LG+OR+cat:stat.ML"
     url = f"http://export.arxiv.org/api/query?search_query={query}&sortBy=submittedDate&sortOrder=descending&max_results={max_results}"
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff_ts = _cutoff_ts(days)
     hits: List[ArticleHit] = []
     try:
-        feed = feedparser.parse(url)
+        feed = _fetch_feed(url)
         for entry in feed.entries:
             published = entry.get("published_parsed")
             if published:
-                pub_dt = datetime(*published[:6])
-                if pub_dt < cutoff:
-                    continue
+                # Sorted newest-first by submission date: everything after this is older
+                if calendar.timegm(published) < cutoff_ts:
+                    break
             else:
                 # No date — skip
                 continue
@@ -610,9 +856,9 @@ def collect_research(days: int) -> List[ArticleHit]:
 
 def _fetch_pwc_trending(limit: int = 10, days: int = 30) -> List[ArticleHit]:
     rss_url = "https://paperswithcode.com/trending?format=rss"
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff_ts = _cutoff_ts(days)
     try:
-        feed = feedparser.parse(rss_url)
+        feed = _fetch_feed(rss_url)
     except Exception:
         return []
     hits: List[ArticleHit] = []
@@ -620,8 +866,7 @@ def _fetch_pwc_trending(limit: int = 10, days: int = 30) -> List[ArticleHit]:
         # Date filter
         published = entry.get("published_parsed") or entry.get("updated_parsed")
         if published:
-            pub_dt = datetime(*published[:6])
-            if pub_dt < cutoff:
+            if calendar.timegm(published) < cutoff_ts:
                 continue
         else:
             # No date — skip to avoid stale content
@@ -644,10 +889,11 @@ def _fetch_pwc_trending(limit: int = 10, days: int = 30) -> List[ArticleHit]:
 
 
 def collect_ai_progress(days: int) -> List[ArticleHit]:
-    hits: List[ArticleHit] = []
-    hits.extend(_fetch_pwc_trending(limit=15, days=days))
-    # Tavily fallback — PapersWithCode RSS is often empty for short windows
-    hits.extend(search_stream(DEFAULT_STREAMS["ai_progress"], days))
+    hits = _gather(
+        lambda: _fetch_pwc_trending(limit=15, days=days),
+        # Tavily fallback — PapersWithCode RSS is often empty for short windows
+        lambda: search_stream(DEFAULT_STREAMS["ai_progress"], days),
+    )
     return _dedupe(hits)
 
 
@@ -656,9 +902,10 @@ def collect_ai_progress(days: int) -> List[ArticleHit]:
 
 def collect_canadian(days: int) -> List[ArticleHit]:
     """Prioritise Google Alert RSS for Canadian AI news, Tavily as fallback."""
-    hits: List[ArticleHit] = []
-    hits.extend(fetch_google_alerts("canadian", limit=10, days=days))
-    hits.extend(search_stream(DEFAULT_STREAMS["canadian"], days))
+    hits = _gather(
+        lambda: fetch_google_alerts("canadian", limit=10, days=days),
+        lambda: search_stream(DEFAULT_STREAMS["canadian"], days),
+    )
     return _dedupe(hits)
 
 
@@ -668,9 +915,10 @@ def collect_canadian(days: int) -> List[ArticleHit]:
 
 def collect_global(days: int) -> List[ArticleHit]:
     """Prioritise Google Alert RSS for global AI policy news, Tavily as fallback."""
-    hits: List[ArticleHit] = []
-    hits.extend(fetch_google_alerts("global", limit=10, days=days))
-    hits.extend(search_stream(DEFAULT_STREAMS["global"], days))
+    hits = _gather(
+        lambda: fetch_google_alerts("global", limit=10, days=days),
+        lambda: search_stream(DEFAULT_STREAMS["global"], days),
+    )
     return _dedupe(hits)
 
 
@@ -692,10 +940,9 @@ EVENT_QUERIES = [
 def _fetch_event_feeds(days: int) -> List[ArticleHit]:
     """Fetch AI event announcements from RSS feeds."""
     hits: List[ArticleHit] = []
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in EVENT_FEEDS:
+    cutoff_ts = _cutoff_ts(days)
+    for feed in _fetch_feeds(EVENT_FEEDS):
         try:
-            feed = feedparser.parse(url)
             for entry in feed.entries[:10]:
                 title = entry.get("title", "").lower()
                 # only keep entries that look event-related
@@ -703,8 +950,7 @@ def _fetch_event_feeds(days: int) -> List[ArticleHit]:
                     continue
                 published = entry.get("published_parsed") or entry.get("updated_parsed")
                 if published:
-                    pub_dt = datetime(*published[:6])
-                    if pub_dt < cutoff:
+                    if calendar.timegm(published) < cutoff_ts:
                         continue
                 else:
                     continue
@@ -727,20 +973,12 @@ def _fetch_event_feeds(days: int) -> List[ArticleHit]:
 
 def collect_events(days: int) -> List[ArticleHit]:
     """Search for upcoming AI events — multiple sources for resilience."""
-    hits: List[ArticleHit] = []
-
-    # RSS feeds first
-    try:
-        hits.extend(_fetch_event_feeds(days))
-    except Exception:
-        pass
-
-    # Multiple Tavily queries as fallback
-    for query_cfg in EVENT_QUERIES:
-        try:
-            hits.extend(search_stream(query_cfg, days))
-        except Exception:
-            continue
+    hits = _gather(
+        # RSS feeds first
+        lambda: _or_empty(_fetch_event_feeds, days),
+        # Multiple Tavily queries as fallback
+        *(lambda cfg=query_cfg: _or_empty(search_stream, cfg, days) for query_cfg in EVENT_QUERIES),
+    )
 
     # Original default query as final fallback
     if not hits:
@@ -762,19 +1000,24 @@ REPORT_FEEDS = [
 
 def collect_deep_dive(days: int) -> List[ArticleHit]:
     """Search for in-depth AI reports from OECD, Anthropic, MIT, METR, NIST, etc."""
+    hits = _gather(
+        # Tavily search
+        lambda: search_stream(DEFAULT_STREAMS["deep_dive"], days),
+        lambda: _fetch_report_feeds(days),
+    )
+    return _dedupe(hits)
+
+
+def _fetch_report_feeds(days: int) -> List[ArticleHit]:
+    """RSS feeds from report-publishing orgs."""
     hits: List[ArticleHit] = []
-    # Tavily search
-    hits.extend(search_stream(DEFAULT_STREAMS["deep_dive"], days))
-    # RSS feeds from report-publishing orgs
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    for url in REPORT_FEEDS:
+    cutoff_ts = _cutoff_ts(days)
+    for feed in _fetch_feeds(REPORT_FEEDS):
         try:
-            feed = feedparser.parse(url)
             for entry in feed.entries[:8]:
                 published = entry.get("published_parsed") or entry.get("updated_parsed")
                 if published:
-                    pub_dt = datetime(*published[:6])
-                    if pub_dt < cutoff:
+                    if calendar.timegm(published) < cutoff_ts:
                         continue
                 else:
                     continue
@@ -792,15 +1035,20 @@ def collect_deep_dive(days: int) -> List[ArticleHit]:
                 )
         except Exception:
             continue
-    return _dedupe(hits)
-
+    return hits
 
 
 def get_streams(custom_limits: int | None = None) -> Dict[str, SectionConfig]:
-    streams: Dict[str, SectionConfig] = {}
-    for key, cfg in DEFAULT_STREAMS.items():
-        new_cfg = replace(cfg)
-        if custom_limits:
-            new_cfg.limit = custom_limits
-        streams[key] = new_cfg
-    return streams
+    """Section configs, optionally with every limit overridden.
+
+    The configs are frozen and shared between calls — derive variants with
+    dataclasses.replace. The outer dict is a fresh copy.
+    """
+    return dict(_streams_with_limit(custom_limits or None))
+
+
+@lru_cache(maxsize=8)
+def _streams_with_limit(limit: Optional[int]) -> Dict[str, SectionConfig]:
+    if limit is None:
+        return dict(DEFAULT_STREAMS)
+    return {key: replace(cfg, limit=limit) for key, cfg in DEFAULT_STREAMS.items()}
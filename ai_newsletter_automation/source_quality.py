@@ -2,9 +2,10 @@
 
 import json
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 log = logging.getLogger(__name__)
@@ -13,6 +14,9 @@ log = logging.getLogger(__name__)
 _WINDOW_SECONDS = 90 * 24 * 3600  # 90 days
 _FEEDBACK_PENALTY_SECONDS = 7 * 24 * 3600  # 7-day penalty for flagged domains
 
+# Sections finish concurrently; serialise the read-modify-write of the quality file
+_WRITE_LOCK = threading.Lock()
+
 
 def _get_quality_path() -> Path:
     """Quality data file — tries project logs first, falls back to /tmp."""
@@ -74,21 +78,27 @@ class SourceTracker:
 
     def record(self, url: str, relevance_score: int) -> None:
         """Record a relevance score for an article's domain."""
-        domain = _extract_domain(url)
-        if not domain:
+        self.record_many([(url, relevance_score)])
+
+    def record_many(self, pairs: Iterable[Tuple[str, int]]) -> None:
+        """Record several (url, relevance_score) pairs with a single load/save."""
+        now = time.time()
+        entries = []
+        for url, relevance_score in pairs:
+            domain = _extract_domain(url)
+            if domain:
+                entries.append({"domain": domain, "score": relevance_score, "timestamp": now})
+        if not entries:
             return
 
-        data = _load_json(self._quality_path)
-        data.append({
-            "domain": domain,
-            "score": relevance_score,
-            "timestamp": time.time(),
-        })
+        with _WRITE_LOCK:
+            data = _load_json(self._quality_path)
+            data.extend(entries)
 
-        # Prune old entries
-        cutoff = time.time() - _WINDOW_SECONDS
-        data = [d for d in data if d.get("timestamp", 0) > cutoff]
-        _save_json(self._quality_path, data)
+            # Prune old entries
+            cutoff = now - _WINDOW_SECONDS
+            data = [d for d in data if d.get("timestamp", 0) > cutoff]
+            _save_json(self._quality_path, data)
 
     def get_boost(self, url: str) -> float:
         """Get a quality boost (0.0-1.0) for a domain based on historical performance.
@@ -96,41 +106,42 @@ class SourceTracker:
         Returns 0.0 for unknown domains, up to 1.0 for consistently high-quality domains.
         Applies a penalty if the domain has recent negative feedback.
         """
-        domain = _extract_domain(url)
-        if not domain:
-            return 0.0
-
-        # Check for recent negative feedback
-        penalty = self._get_penalty(domain)
-
-        # Calculate average score from history
-        data = _load_json(self._quality_path)
-        cutoff = time.time() - _WINDOW_SECONDS
-        scores = [
-            d["score"] for d in data
-            if d.get("domain") == domain and d.get("timestamp", 0) > cutoff
-        ]
-
-        if not scores:
-            return 0.0
-
-        avg = sum(scores) / len(scores)
-        # Normalize to 0-1 range (scores are 1-10, so (avg-5)/5 gives -0.8 to 1.0)
-        boost = max(0.0, (avg - 5.0) / 5.0)
-        return max(0.0, boost - penalty)
-
-    def _get_penalty(self, domain: str) -> float:
-        """Check feedback log for recent negative flags on this domain."""
-        data = _load_json(self._feedback_path)
-        cutoff = time.time() - _FEEDBACK_PENALTY_SECONDS
-        recent_flags = [
-            d for d in data
-            if d.get("domain") == domain
-            and d.get("rating") == "down"
-            and d.get("timestamp", 0) > cutoff
-        ]
-        # Each flag in the last 7 days adds 0.2 penalty, capped at 1.0
-        return min(1.0, len(recent_flags) * 0.2)
+        return self.get_boosts([url])[url]
+
+    def get_boosts(self, urls: Iterable[str]) -> Dict[str, float]:
+        """get_boost for many URLs at once, reading each data file a single time."""
+        domains = {url: _extract_domain(url) for url in urls}
+        wanted = set(domains.values())
+        wanted.discard("")
+
+        # Average score from history, per domain
+        totals: Dict[str, Tuple[float, int]] = {}
+        if wanted:
+            cutoff = time.time() - _WINDOW_SECONDS
+            for d in _load_json(self._quality_path):
+                domain = d.get("domain")
+                if domain in wanted and d.get("timestamp", 0) > cutoff:
+                    total, count = totals.get(domain, (0.0, 0))
+                    totals[domain] = (total + d["score"], count + 1)
+
+        # Recent negative feedback, only needed for domains that have history
+        flags: Dict[str, int] = {}
+        if totals:
+            cutoff = time.time() - _FEEDBACK_PENALTY_SECONDS
+            for d in _load_json(self._feedback_path):
+                domain = d.get("domain")
+                if domain in totals and d.get("rating") == "down" and d.get("timestamp", 0) > cutoff:
+                    flags[domain] = flags.get(domain, 0) + 1
+
+        boosts: Dict[str, float] = {}
+        for domain, (total, count) in totals.items():
+            avg = total / count
+            # Normalize to 0-1 range (scores are 1-10, so (avg-5)/5 gives -0.8 to 1.0)
+            boost = max(0.0, (avg - 5.0) / 5.0)
+            # Each flag in the last 7 days adds 0.2 penalty, capped at 1.0
+            penalty = min(1.0, flags.get(domain, 0) * 0.2)
+            boosts[domain] = max(0.0, boost - penalty)
+        return {url: boosts.get(domain, 0.0) for url, domain in domains.items()}
 
     def record_feedback(self, url: str, rating: str) -> None:
         """Record user feedback (thumbs up/down) for an article's domain."""
@@ -163,9 +174,27 @@ class SourceTracker:
             stats[domain]["count"] += 1
 
         # Compute averages
+        boosts = self.get_boosts(f"https://{domain}/" for domain in stats)
         for domain, info in stats.items():
             info["avg_score"] = sum(info["scores"]) / len(info["scores"])
-            info["boost"] = self.get_boost(f"https://{domain}/")
+            info["boost"] = boosts[f"https://{domain}/"]
             del info["scores"]  # Don't expose raw scores
 
         return stats
+
+
+_TRACKER_LOCK = threading.Lock()
+_tracker: Optional[SourceTracker] = None
+
+
+def get_tracker() -> SourceTracker:
+    """One SourceTracker per process, created on first use.
+
+    Built lazily so the data paths resolve against the settings in effect at
+    run time rather than at import.
+    """
+    global _tracker
+    with _TRACKER_LOCK:
+        if _tracker is None:
+            _tracker = SourceTracker()
+        return _tracker
@@ -1,6 +1,9 @@
+import concurrent.futures
 import json
+import threading
 import time
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
 import requests
 
@@ -105,39 +108,54 @@ import google.generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 from google.api_core import exceptions
 
-def _configure_gemini():
-    settings = get_settings()
-    genai.configure(api_key=settings.gemini_api_key)
+_CONFIGURE_LOCK = threading.Lock()
+_configured_key: Optional[str] = None
 
-def _gemini_request(
-    system_prompt: str,
-    user_prompt: str,
-    model_name: str = "gemini-3-flash-preview",
-    temperature: float = 0.1,
-) -> str:
-    _configure_gemini()
-    
+
+def _configure_gemini():
+    """Configure the genai client once per API key rather than on every request."""
+    global _configured_key
+    api_key = get_settings().gemini_api_key
+    with _CONFIGURE_LOCK:
+        if _configured_key != api_key:
+            genai.configure(api_key=api_key)
+            _configured_key = api_key
+
+
+# Safety settings: block few things to avoid over-filtering news
+_SAFETY_SETTINGS = {
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_ONLY_HIGH,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
+}
+
+
+@lru_cache(maxsize=32)
+def _get_model(model_name: str, system_prompt: str, temperature: float) -> "genai.GenerativeModel":
+    """One GenerativeModel per (model, prompt, temperature) — sections × languages + TL;DR."""
     generation_config = {
         "temperature": temperature,
         "max_output_tokens": 4096,
         "response_mime_type": "application/json",
     }
-    
-    # Safety settings: block few things to avoid over-filtering news
-    safety_settings = {
-        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
-        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_ONLY_HIGH,
-        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
-        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
-    }
-
-    model = genai.GenerativeModel(
+    return genai.GenerativeModel(
         model_name=model_name,
         system_instruction=system_prompt,
         generation_config=generation_config,
-        safety_settings=safety_settings,
+        safety_settings=_SAFETY_SETTINGS,
     )
 
+
+def _gemini_request(
+    system_prompt: str,
+    user_prompt: str,
+    model_name: str = "gemini-3-flash-preview",
+    temperature: float = 0.1,
+) -> str:
+    _configure_gemini()
+    model = _get_model(model_name, system_prompt, temperature)
+
     # Retry logic for rate limits (429) & server errors (500/503)
     # Retry logic for rate limits (429) & server errors (500/503)
     # Fast Fail for Vercel: Reduce retries to avoid timeouts (60s limit)
@@ -157,6 +175,12 @@ def _gemini_request(
             raise e
     return ""
 
+# Articles per LLM call; larger sections are split and summarised concurrently,
+# at most _SUMMARY_WORKERS calls at a time so a section does not flood the quota
+_SUMMARY_BATCH_SIZE = 4
+_SUMMARY_WORKERS = 3
+
+
 def summarize_section(
     section_name: str,
     articles: List[VerifiedArticle],
@@ -225,14 +249,49 @@ def summarize_section(
     if lang == "fr":
         system_prompt += _FRENCH_PROMPT_MODIFIER
 
-    user_prompt = f"Section: {section_name}\nToday's date: {time.strftime('%Y-%m-%d')}\nSummarize the following verified articles:\n{_build_prompt(articles)}"
-
     # Default to Gemini 2.0 Flash if unspecified or old model name passed
     if "llama" in model:
         model = "gemini-3-flash-preview"
 
-    raw = _gemini_request(system_prompt, user_prompt, model_name=model)
-    return _parse_json(raw, relevance_threshold=relevance_threshold)
+    def summarize_batch(batch: List[VerifiedArticle]) -> List[SummaryItem]:
+        user_prompt = f"Section: {section_name}\nToday's date: {time.strftime('%Y-%m-%d')}\nSummarize the following verified articles:\n{_build_prompt(batch)}"
+        raw = _gemini_request(system_prompt, user_prompt, model_name=model)
+        return _parse_json(raw, relevance_threshold=relevance_threshold)
+
+    batches = [
+        articles[i:i + _SUMMARY_BATCH_SIZE] for i in range(0, len(articles), _SUMMARY_BATCH_SIZE)
+    ]
+    if len(batches) == 1:
+        return summarize_batch(batches[0])
+
+    # Output tokens dominate latency, so several short calls in flight finish
+    # well before one long call. Each batch succeeds or fails on its own.
+    results: List[Optional[List[SummaryItem]]] = [None] * len(batches)
+    failed: List[int] = []
+    workers = min(_SUMMARY_WORKERS, len(batches))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_idx = {executor.submit(summarize_batch, b): i for i, b in enumerate(batches)}
+        for future in concurrent.futures.as_completed(future_to_idx):
+            idx = future_to_idx[future]
+            try:
+                results[idx] = future.result()
+            except Exception:
+                failed.append(idx)
+
+    # Failed batches get one more sequential try, once the others have stopped
+    # competing for the quota; if that fails too, only that batch is dropped
+    error: Optional[Exception] = None
+    for idx in sorted(failed):
+        try:
+            results[idx] = summarize_batch(batches[idx])
+        except Exception as exc:
+            error = exc
+            print(f"Warning: summary batch {idx + 1}/{len(batches)} for {section_name} failed: {exc}")
+    if error is not None and all(r is None for r in results):
+        raise error  # nothing to salvage — fail like a single call would
+
+    # Ranked article order, whatever order the calls finished in
+    return [item for items in results if items for item in items]
 
 
 # ── TL;DR Executive Summary ──
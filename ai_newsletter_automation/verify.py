@@ -1,8 +1,16 @@
+import codecs
 import re
-from typing import Iterable, Optional
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 PAYWALL_PHRASES: Iterable[str] = (
     "subscribe to read",
@@ -34,6 +42,91 @@ DEFAULT_HEADERS = {
 
 MIN_CONTENT_LENGTH = 200  # chars — reject stub / error pages
 
+# lxml is a C parser, several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Pool size covers the section pool x process_hits fan-out without dropping sockets
+_POOL_SIZE = 50
+
+
+def _build_session() -> requests.Session:
+    """Shared keep-alive session so repeat hosts reuse TCP/TLS connections across threads.
+
+    Transient failures (a failed connect, 429/5xx) are retried by the adapter with
+    a short exponential backoff (0.3, 0.6, 1.2 s); the final response is still
+    returned so callers keep their own status checks. Read timeouts are not
+    retried: a host that accepts the connection but never answers would
+    otherwise hold a worker for several full timeouts.
+    """
+    retry = Retry(
+        total=3,
+        connect=1,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(("GET", "HEAD")),
+        raise_on_status=False,
+        respect_retry_after_header=False,  # a long Retry-After would blow the section budget
+    )
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+# Stop downloading after this much HTML: ample for 20k chars of article text, and
+# skips the tail of pages bloated by inline scripts / base64 images
+MAX_HTML_BYTES = 500_000
+
+# (connect, read) — give up fast on dead hosts, allow a little longer for slow bodies
+Timeout = Union[float, Tuple[float, float]]
+FETCH_TIMEOUT: Tuple[float, float] = (3, 8)
+VERIFY_TIMEOUT: Tuple[float, float] = (3, 4)
+
+# At most this many concurrent requests per host, so one slow domain cannot tie
+# up every worker in the process_hits pool
+_PER_HOST_LIMIT = 4
+
+
+class _HostSlot:
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self) -> None:
+        self.semaphore = threading.BoundedSemaphore(_PER_HOST_LIMIT)
+        self.users = 0  # threads holding or waiting on the semaphore
+
+
+# Only hosts with a request in flight have an entry, so the map stays small
+_HOST_SLOTS: Dict[str, _HostSlot] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+@contextmanager
+def host_slot(url: str) -> Iterator[None]:
+    """Hold one of the _PER_HOST_LIMIT request slots for *url*'s host."""
+    host = (urlsplit(url).hostname or "").lower()
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = _HostSlot()
+        slot.users += 1
+    try:
+        with slot.semaphore:
+            yield
+    finally:
+        with _HOST_SLOTS_LOCK:
+            slot.users -= 1
+            if slot.users == 0:
+                del _HOST_SLOTS[host]
+
 
 def is_paywalled(html: str) -> bool:
     haystack = html.lower()
@@ -46,36 +139,110 @@ def is_soft_404(html: str) -> bool:
     return any(phrase in haystack for phrase in SOFT_404_PHRASES)
 
 
-def verify_link(url: str, timeout: int = 4) -> Optional[str]:
+class TTLCache:
+    """Small thread-safe LRU with per-entry expiry, shared by the fetch and feed caches."""
+
+    def __init__(self, max_items: int = 4096):
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_items = max_items
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_items:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Sections cross-post the same stories and retries re-verify the same hits
+_URL_CACHE = TTLCache()
+_SUCCESS_TTL = 600
+_FAILURE_TTL = 120
+
+
+def canonical_url(url: str) -> str:
+    """Lowercase scheme/host, drop the fragment and trailing slash."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def verify_link(url: str, timeout: Timeout = VERIFY_TIMEOUT) -> Optional[str]:
     """Fetch *url* and return the HTML if the page is reachable, is HTML,
     has enough content, and is not behind a paywall or soft-404.
-    Returns ``None`` on any failure so that the caller can skip the article."""
+    Returns ``None`` on any failure so that the caller can skip the article.
+    Results (including failures) are cached briefly per normalized URL."""
+    key = canonical_url(url)
+    hit, html = _URL_CACHE.get(key)
+    if hit:
+        return html
+    html = _fetch_and_verify(url, timeout)
+    _URL_CACHE.set(key, html, _SUCCESS_TTL if html is not None else _FAILURE_TTL)
+    return html
+
+
+def read_capped(resp: requests.Response, limit: int = MAX_HTML_BYTES) -> str:
+    """Read at most *limit* bytes of a streamed response body and decode it."""
+    chunks = []
+    total = 0
+    for chunk in resp.iter_content(chunk_size=65_536):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return b"".join(chunks)[:limit].decode(_codec(resp.encoding), errors="replace")
+
+
+def _codec(encoding: Optional[str]) -> str:
+    """*encoding* if Python knows it (servers send names like "utf8mb4"), else utf-8."""
+    if encoding:
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _fetch_and_verify(url: str, timeout: Timeout) -> Optional[str]:
     try:
-        resp = requests.get(
-            url,
-            headers=DEFAULT_HEADERS,
-            timeout=timeout,
-            allow_redirects=True,
-        )
-    except requests.RequestException:
-        return None
+        with host_slot(url):
+            with SESSION.get(url, timeout=timeout, allow_redirects=True, stream=True) as resp:
+                if resp.status_code != 200:
+                    return None
 
-    if resp.status_code != 200:
-        return None
+                # Too many redirects is suspicious (login walls, etc.)
+                if len(resp.history) > 5:
+                    return None
 
-    # Too many redirects is suspicious (login walls, etc.)
-    if len(resp.history) > 5:
-        return None
+                content_type = resp.headers.get("Content-Type", "")
+                if "text/html" not in content_type:
+                    return None
 
-    content_type = resp.headers.get("Content-Type", "")
-    if "text/html" not in content_type:
+                text = read_capped(resp)
+    except requests.RequestException:
         return None
 
-    text = resp.text
     sample = text[:100_000]
 
     # Minimum content check — reject stubs and error pages
-    soup = BeautifulSoup(sample, "html.parser")
+    soup = BeautifulSoup(sample, HTML_PARSER)
     body_text = soup.get_text(separator=" ", strip=True)
     if len(body_text) < MIN_CONTENT_LENGTH:
         return None
@@ -14,17 +14,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from ai_newsletter_automation.search import (
     get_streams,
-    collect_trending, collect_events,
-    collect_research, collect_ai_progress, collect_canadian,
-    collect_global, collect_deep_dive,
     search_stream,
-    _filter_by_keywords,
-    _boost_by_keywords,
-    _boost_by_source_quality,
-    _sort_by_source_priority,
-    _apply_time_decay,
+    _rank_hits,
 )
-from ai_newsletter_automation.runner import SECTION_ORDER
+from ai_newsletter_automation.runner import SECTION_ORDER, _COLLECTORS
 
 
 class handler(BaseHTTPRequestHandler):
@@ -61,28 +54,15 @@ class handler(BaseHTTPRequestHandler):
             streams = get_streams(custom_limits=int(limit_override) if limit_override else None)
             cfg = streams[key]
 
-            collectors = {
-                "trending": lambda c: collect_trending(c.days or days),
-                "events": lambda c: collect_events(c.days or days),
-                "research_plain": lambda c: collect_research(c.days or days),
-                "ai_progress": lambda c: collect_ai_progress(c.days or days),
-                "canadian": lambda c: collect_canadian(c.days or days),
-                "global": lambda c: collect_global(c.days or days),
-                "deep_dive": lambda c: collect_deep_dive(c.days or days),
-            }
-
             # Collection (Tavily search — fast, returns snippets)
-            if key in collectors:
-                hits = collectors[key](cfg)
+            collector = _COLLECTORS.get(key)
+            if collector is not None:
+                hits = collector(cfg, days)
             else:
                 hits = search_stream(cfg, cfg.days or days)
 
             # Lightweight curation (no scraping, no verification)
-            hits = _filter_by_keywords(hits, cfg.reject_keywords)
-            hits = _boost_by_keywords(hits, cfg.boost_keywords)
-            hits = _boost_by_source_quality(hits)
-            hits = _sort_by_source_priority(hits)
-            hits = _apply_time_decay(hits, cfg.days or days)
+            hits = _rank_hits(hits, cfg, cfg.days or days)
 
             # Simple dedup by URL
             seen_urls = set()
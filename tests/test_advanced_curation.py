@@ -1,10 +1,18 @@
 """Tests for advanced curation features: dedup, time-decay, UTM tracking, source quality."""
 
+import random
 import time
 from datetime import datetime, timedelta
 
 from ai_newsletter_automation.models import ArticleHit, VerifiedArticle, SummaryItem
-from ai_newsletter_automation.dedup import deduplicate, _title_similarity
+from ai_newsletter_automation.dedup import (
+    deduplicate,
+    _content_shingles,
+    _lsh_pairs,
+    _title_similarity,
+    _token_jaccard,
+    _token_set,
+)
 from ai_newsletter_automation.search import _apply_time_decay
 from ai_newsletter_automation.assemble import _add_utm
 from ai_newsletter_automation.source_quality import SourceTracker, _extract_domain
@@ -32,6 +40,31 @@ def test_title_similarity_partial():
     assert score >= 0.7
 
 
+def test_token_jaccard_ignores_case_and_punctuation():
+    a = _token_set("OpenAI's GPT-5: what to know")
+    b = _token_set("openais gpt5 What to know")
+    assert _token_jaccard(a, b) == 1.0
+    assert _token_jaccard(_token_set("AI revolution"), _token_set("cooking recipes")) == 0.0
+
+
+def test_deduplicate_merges_compound_token_variants():
+    articles = [
+        _make_verified("GPT-5 launched", "https://a.com/1"),
+        _make_verified("GPT5 launch", "https://b.com/2"),
+    ]
+    assert len(deduplicate(articles)) == 1
+
+
+def test_deduplicate_threshold_controls_jaccard_shortcut():
+    """Half the words shared: a duplicate at 0.5, not at the stricter 0.9."""
+    articles = [
+        _make_verified("alpha bravo charlie", "https://a.com/1"),
+        _make_verified("alpha bravo delta", "https://b.com/2"),
+    ]
+    assert len(deduplicate(articles, threshold=0.5)) == 1
+    assert len(deduplicate(articles, threshold=0.9)) == 2
+
+
 def test_deduplicate_removes_near_duplicates():
     articles = [
         _make_verified("OpenAI launches GPT-5", "https://a.com/1", content="Full article text here with details"),
@@ -45,6 +78,39 @@ def test_deduplicate_removes_near_duplicates():
     assert result[1].url == "https://c.com/3"
 
 
+def test_deduplicate_clusters_transitively():
+    """A~B and B~C collapse into one story even when A and C differ more."""
+    articles = [
+        _make_verified("alpha bravo charlie delta", "https://a.com/1"),
+        _make_verified("alpha bravo charlie delta echo", "https://b.com/2", content="richest version"),
+        _make_verified("charlie delta echo foxtrot", "https://c.com/3"),
+    ]
+    result = deduplicate(articles)
+    assert [a.url for a in result] == ["https://b.com/2"]
+
+
+def test_deduplicate_merges_reheadlined_syndication():
+    """Different headlines over the same wire copy are one story."""
+    body = " ".join(f"word{i}" for i in range(200))
+    articles = [
+        _make_verified("Regulators unveil new AI rules", "https://a.com/1", content=body),
+        _make_verified("What the latest policy means for you", "https://b.com/2", content=body + " Updated."),
+        _make_verified("Unrelated sports recap", "https://c.com/3", content=body[::-1]),
+    ]
+    result = deduplicate(articles)
+    assert [a.url for a in result] == ["https://b.com/2", "https://c.com/3"]
+
+
+def test_deduplicate_ignores_shared_short_interstitial_body():
+    """Two stories that both resolved to the same consent page stay separate."""
+    consent = "We value your privacy. Accept all cookies to continue reading."
+    articles = [
+        _make_verified("Ottawa funds AI research centres", "https://a.com/1", content=consent),
+        _make_verified("Chipmaker posts record quarter", "https://b.com/2", content=consent),
+    ]
+    assert len(deduplicate(articles)) == 2
+
+
 def test_deduplicate_keeps_unique():
     articles = [
         _make_verified("Google unveils quantum computing breakthrough", "https://a.com/1"),
@@ -64,6 +130,31 @@ def test_deduplicate_single():
     assert deduplicate(articles) == articles
 
 
+def test_deduplicate_large_batch_collapses_near_duplicates():
+    """Hundreds of titles are still compared pairwise and collapse near-duplicates."""
+    rng = random.Random(0)
+    words = ["quantum", "policy", "robotics", "farming", "privacy", "chips", "ottawa", "budget",
+             "vision", "speech", "climate", "health", "security", "startup", "benchmark", "treaty"]
+    titles = {" ".join(rng.sample(words, 4)) + f" #{i}" for i in range(300)}
+    articles = [_make_verified(t, f"https://a.com/{i}") for i, t in enumerate(sorted(titles))]
+    unique = deduplicate(articles)
+    dup_of = unique[0].title
+    articles.append(_make_verified(dup_of + " today", "https://b.com/dup", content="longer content"))
+    result = deduplicate(articles)
+    assert len(result) == len(unique)
+    assert "https://b.com/dup" in {a.url for a in result}
+
+
+def test_lsh_pairs_buckets_near_identical_bodies():
+    rng = random.Random(1)
+    vocab = [f"w{i}" for i in range(500)]
+    bodies = [" ".join(rng.choices(vocab, k=200)) for _ in range(20)]
+    bodies.append(bodies[3] + " with one added closing sentence")
+    pairs = _lsh_pairs({i: _content_shingles(b) for i, b in enumerate(bodies)})
+    assert (3, 20) in pairs
+    assert len(pairs) < 10
+
+
 # ── Time-decay tests ──
 
 def _make_hit(title="Test", published=None, url="https://example.com"):
@@ -128,6 +219,18 @@ def test_add_utm_empty():
     assert _add_utm("", "trending", "2026-02-19") == ""
 
 
+def test_add_utm_keeps_existing_query_verbatim():
+    result = _add_utm("https://example.com/a?id=1&empty=", "canadian", "2026-02-19")
+    assert result.startswith("https://example.com/a?id=1&empty=&utm_source=ai_this_week")
+    assert result.endswith("utm_content=canadian")
+
+
+def test_add_utm_merges_before_fragment():
+    result = _add_utm("https://example.com/a#top", "trending", "2026-02-19")
+    assert result.startswith("https://example.com/a?utm_source=ai_this_week")
+    assert result.endswith("#top")
+
+
 # ── Source quality tests ──
 
 def test_extract_domain():
@@ -140,3 +243,26 @@ def test_source_tracker_get_boost_unknown():
     """Unknown domains should return 0.0 boost."""
     tracker = SourceTracker()
     assert tracker.get_boost("https://never-seen-before-domain-xyz.com/") == 0.0
+
+
+def test_source_tracker_record_many_single_write(tmp_path):
+    tracker = SourceTracker()
+    tracker._quality_path = tmp_path / "source_quality.json"
+    tracker._feedback_path = tmp_path / "feedback.json"
+    tracker.record_many([
+        ("https://www.good.example/a", 9),
+        ("https://good.example/b", 9),
+        ("", 10),
+    ])
+    assert tracker.get_boost("https://good.example/") == 0.8
+    assert tracker.get_domain_stats()["good.example"]["count"] == 2
+
+
+def test_source_tracker_get_boosts_matches_get_boost(tmp_path):
+    tracker = SourceTracker()
+    tracker._quality_path = tmp_path / "source_quality.json"
+    tracker._feedback_path = tmp_path / "feedback.json"
+    tracker.record_many([("https://good.example/a", 9), ("https://meh.example/a", 7)])
+    tracker.record_feedback("https://meh.example/a", "down")
+    urls = ["https://good.example/x", "https://www.meh.example/y", "https://new.example/", ""]
+    assert tracker.get_boosts(urls) == {u: tracker.get_boost(u) for u in urls}
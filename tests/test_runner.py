@@ -0,0 +1,51 @@
+import time
+
+from ai_newsletter_automation import runner, scrape
+from ai_newsletter_automation.models import ArticleHit
+
+
+def test_process_hits_keeps_ranked_order(monkeypatch, tmp_path):
+    """Later-ranked hits finishing first must not jump ahead of earlier ones."""
+    def fake_fetch(url):
+        # First-ranked hit is slowest to respond
+        time.sleep(0.05 * (3 - int(url.rsplit("/", 1)[1])))
+        return "<html></html>", f"content for {url}", None
+
+    monkeypatch.setattr(runner, "fetch_and_extract", fake_fetch)
+    hits = [ArticleHit(title=f"t{i}", url=f"https://example.com/{i}", snippet="") for i in range(3)]
+    result = runner.process_hits(hits, limit=3, log_file=tmp_path / "log.jsonl")
+    assert [a.url for a in result] == [h.url for h in hits]
+
+
+def test_parse_item_date_formats():
+    assert runner._parse_item_date("2026-03-04").isoformat() == "2026-03-04"
+    assert runner._parse_item_date("2026-3-4").isoformat() == "2026-03-04"
+    assert runner._parse_item_date("March 4, 2026").isoformat() == "2026-03-04"
+    assert runner._parse_item_date("Mar 4, 2026").isoformat() == "2026-03-04"
+    assert runner._parse_item_date("4 March 2026").isoformat() == "2026-03-04"
+    assert runner._parse_item_date("next week") is None
+    assert runner._parse_item_date("2026-13-01") is None
+
+
+def test_process_hits_fills_missing_published_from_page(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        runner, "fetch_and_extract", lambda url: ("<html></html>", "body", "2026-03-04")
+    )
+    hits = [
+        ArticleHit(title="a", url="https://example.com/a", snippet=""),
+        ArticleHit(title="b", url="https://example.com/b", snippet="", published="2026-03-01"),
+    ]
+    result = runner.process_hits(hits, limit=2, log_file=tmp_path / "log.jsonl")
+    assert [a.published for a in result] == ["2026-03-04", "2026-03-01"]
+
+
+def test_process_single_hit_falls_back_to_snippet_on_parse_error(monkeypatch, tmp_path):
+    def broken_parse(html):
+        raise AssertionError("parser blew up")
+
+    monkeypatch.setattr(scrape, "verify_link", lambda url: "<html>odd page</html>")
+    monkeypatch.setattr(scrape, "parse_article", broken_parse)
+    snippet = "An RSS summary that is long enough to stand in for the article."
+    hit = ArticleHit(title="t", url="https://example.com/odd", snippet=snippet)
+    article = runner._process_single_hit(hit, tmp_path / "log.jsonl")
+    assert article is not None and article.content == snippet
@@ -1,5 +1,8 @@
 
 import unittest
+from unittest import mock
+
+from ai_newsletter_automation import scrape
 from ai_newsletter_automation.scrape import extract_metadata
 
 class TestScrapeMetadata(unittest.TestCase):
@@ -56,5 +59,50 @@ class TestScrapeMetadata(unittest.TestCase):
         meta = extract_metadata(html)
         self.assertEqual(meta.get("date"), "2023-10-24")
 
+    def test_meta_priority_not_document_order(self):
+        html = """
+        <html>
+            <head>
+                <meta name="date" content="2023-10-01" />
+                <meta property="article:published_time" content="2023-10-02" />
+            </head>
+        </html>
+        """
+        meta = extract_metadata(html)
+        self.assertEqual(meta.get("date"), "2023-10-02")
+
+    def test_fetch_and_extract_reads_json_ld_before_stripping_scripts(self):
+        html = """
+        <html>
+            <head>
+                <script type="application/ld+json">{"datePublished": "2023-10-23"}</script>
+            </head>
+            <body><p>Body text</p></body>
+        </html>
+        """
+        with mock.patch.object(scrape, "verify_link", return_value=html):
+            got_html, content, date = scrape.fetch_and_extract("https://example.com/a")
+        self.assertEqual(got_html, html)
+        self.assertEqual(content, "Body text")
+        self.assertEqual(date, "2023-10-23")
+
+    def test_extract_text_prefers_single_article_body(self):
+        story = "Sentence about the actual news. " * 30
+        html = f"""
+        <html><body>
+            <nav>Home | World | Tech</nav>
+            <div class="cookie">We use cookies to improve your experience.</div>
+            <article><p>{story}</p></article>
+            <div class="related">Related: ten other stories you may like</div>
+        </body></html>
+        """
+        text = scrape.extract_text(html)
+        self.assertEqual(text, story.strip())
+
+    def test_extract_text_keeps_page_when_article_is_stub(self):
+        html = "<html><body><article>Short teaser</article><p>Main text</p></body></html>"
+        text = scrape.extract_text(html)
+        self.assertIn("Main text", text)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,17 +1,47 @@
-from ai_newsletter_automation.models import ArticleHit
+import dataclasses
+import time
+from datetime import datetime, timedelta
+
+import feedparser
+import pytest
+
+from ai_newsletter_automation import fast_feed, feed_cache, search
+from ai_newsletter_automation.models import ArticleHit, SectionConfig
 from ai_newsletter_automation.search import (
+    _apply_time_decay,
+    _boost_by_source_quality,
+    _rank_hits,
+    _dedupe,
     _filter_by_date,
+    _parse_date_str,
     _is_blocked_url,
     _unwrap_google_redirect,
     _filter_by_keywords,
     _boost_by_keywords,
     _sort_by_source_priority,
     _filter_blocked,
+    _post_filter,
+    _gather,
+    get_streams,
     DEFAULT_STREAMS,
     _TRUSTED_SOURCES,
 )
 
 
+class _FeedResponse:
+    def __init__(self, status, content=b"", headers=None):
+        self.status_code, self.content, self.headers = status, content, headers or {}
+        self.url = "https://example.com/feed"
+
+
+def _fake_feed_get(calls, respond):
+    """Build a stand-in for ``search._HTTP.get`` that records each call."""
+    def fake_get(url, timeout, headers):
+        calls.append((url, headers))
+        return respond(url, headers)
+    return fake_get
+
+
 def test_filter_by_date_rejects_dateless_untrusted():
     """Undated articles from unknown sources should be rejected."""
     hits = [
@@ -72,6 +102,11 @@ def test_is_blocked_url_allowed():
     assert _is_blocked_url("https://www.reuters.com/article/123") is False
 
 
+def test_is_blocked_url_matches_whole_domain_labels():
+    assert _is_blocked_url("https://blog.medium.com/post") is True
+    assert _is_blocked_url("https://notmedium.com/post") is False
+
+
 def test_default_queries_no_single_words():
     """All Tavily queries should be multi-word and targeted, not generic single-word."""
     for key, cfg in DEFAULT_STREAMS.items():
@@ -148,6 +183,15 @@ def test_filter_blocked_with_section_excludes():
     assert filtered[0].title == "Good article"
 
 
+def test_section_excludes_match_whole_domain_labels():
+    hits = [
+        ArticleHit(title="Sub", url="https://old.reddit.com/r/ai/1", snippet="s"),
+        ArticleHit(title="Lookalike", url="https://notreddit.com/post", snippet="s"),
+    ]
+    filtered = _filter_blocked(hits, extra_excludes=["Reddit.com"])
+    assert [h.title for h in filtered] == ["Lookalike"]
+
+
 def test_section_configs_have_valid_thresholds():
     """All section relevance_threshold values must be between 1 and 10."""
     for key, cfg in DEFAULT_STREAMS.items():
@@ -166,3 +210,178 @@ def test_section_configs_days_override():
     assert DEFAULT_STREAMS["deep_dive"].days == 14
     assert DEFAULT_STREAMS["ai_progress"].days == 14
     assert DEFAULT_STREAMS["research_plain"].days == 14
+
+
+def test_rank_hits_matches_chained_pipeline():
+    """The fused ranker must order hits exactly like the five chained helpers."""
+    now = datetime.utcnow()
+    sources = [None, "RSS", "Google Alert", "Tavily"]
+    words = ["GPT launch", "crypto coin", "policy news", "GPT regulation update", "weather"]
+    hits = [
+        ArticleHit(
+            title=words[i % len(words)],
+            url=f"https://site{i % 3}.example/{i}",
+            snippet="",
+            source=sources[i % len(sources)],
+            published=(now - timedelta(days=i % 4)).strftime("%Y-%m-%d") if i % 5 else None,
+        )
+        for i in range(40)
+    ]
+    cfg = SectionConfig(
+        name="Test", query="q", limit=5,
+        boost_keywords=["GPT", "regulation"], reject_keywords=["crypto"],
+    )
+
+    expected = _filter_by_keywords(hits, cfg.reject_keywords)
+    expected = _boost_by_keywords(expected, cfg.boost_keywords)
+    expected = _boost_by_source_quality(expected)
+    expected = _sort_by_source_priority(expected)
+    expected = _apply_time_decay(expected, 7)
+
+    assert _rank_hits(hits, cfg, 7) == expected
+
+
+def test_post_filter_matches_chained_filters():
+    """The fused post-filter must keep and order hits like the four chained helpers."""
+    now = datetime.utcnow()
+    sources = [None, "RSS", "Tavily"]
+    words = ["GPT launch", "crypto coin", "policy news", "GPT regulation update", "weather"]
+    hosts = ["site.example", "en.wikipedia.org", "reddit.com", "news.example"]
+    hits = [
+        ArticleHit(
+            title=words[i % len(words)],
+            url=f"https://{hosts[i % len(hosts)]}/{i}",
+            snippet="",
+            source=sources[i % len(sources)],
+            published=(now - timedelta(days=i % 12)).strftime("%Y-%m-%d") if i % 5 else None,
+        )
+        for i in range(60)
+    ]
+    cfg = SectionConfig(
+        name="Test", query="q", limit=5, exclude_domains=["reddit.com"],
+        boost_keywords=["GPT", "regulation"], reject_keywords=["crypto"],
+    )
+
+    expected = _filter_blocked(hits, extra_excludes=cfg.exclude_domains)
+    expected = _filter_by_date(expected, 7)
+    expected = _filter_by_keywords(expected, cfg.reject_keywords)
+    expected = _boost_by_keywords(expected, cfg.boost_keywords)
+
+    assert expected
+    assert _post_filter(hits, cfg, 7) == expected
+
+
+def test_fetch_feed_reuses_cached_entries_on_304(monkeypatch, tmp_path):
+    rss = (
+        b'<?xml version="1.0"?><rss version="2.0"><channel><title>f</title>'
+        b"<item><title>A</title><link>https://example.com/a</link>"
+        b"<pubDate>Mon, 12 Oct 2026 10:00:00 GMT</pubDate></item></channel></rss>"
+    )
+    calls = []
+
+    def respond(url, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return _FeedResponse(304)
+        return _FeedResponse(200, rss, {"Content-Type": "application/rss+xml", "ETag": '"v1"'})
+
+    monkeypatch.setattr(feed_cache, "_get_cache_path", lambda: tmp_path / "feed_cache.json")
+    monkeypatch.setattr(feed_cache, "_cache", None)
+    monkeypatch.setattr(feed_cache, "_dirty", False)
+    monkeypatch.setattr(search._HTTP, "get", _fake_feed_get(calls, respond))
+    monkeypatch.setattr(search, "_FEED_MEMO", search.TTLCache(max_items=4))
+
+    first = search._fetch_feed("https://example.com/feed")
+    feed_cache.save()  # normally done once at exit
+    monkeypatch.setattr(feed_cache, "_cache", None)  # force a reload from disk
+    search._FEED_MEMO.clear()  # skip the in-run memo so the request is made
+    second = search._fetch_feed("https://example.com/feed")
+
+    assert "If-None-Match" not in calls[0][1]
+    assert calls[1][1]["If-None-Match"] == '"v1"'
+    assert [e.get("link") for e in second.entries] == [e.get("link") for e in first.entries]
+    assert datetime(*second.entries[0].get("published_parsed")[:6]) == datetime(2026, 10, 12, 10)
+
+
+def test_parse_date_str_iso_and_rfc2822():
+    assert _parse_date_str("2026-02-18") == datetime(2026, 2, 18)
+    assert _parse_date_str("2026-02-18T10:00:00Z") == datetime(2026, 2, 18, 10)
+    assert _parse_date_str("2026-02-18T10:00:00+02:00") == datetime(2026, 2, 18, 8)
+    assert _parse_date_str("Wed, 18 Feb 2026 10:00:00 GMT") == datetime(2026, 2, 18, 10)
+    assert _parse_date_str("Wed, 18 Feb 2026 10:00:00 +0200") == datetime(2026, 2, 18, 8)
+    assert _parse_date_str("not a date") is None
+
+
+def test_gather_keeps_source_order():
+    def source(name, delay):
+        def fetch():
+            time.sleep(delay)
+            return [ArticleHit(title=name, url=f"https://example.com/{name}", snippet="s")]
+        return fetch
+
+    hits = _gather(source("slow", 0.05), source("fast", 0))
+    assert [h.title for h in hits] == ["slow", "fast"]
+
+
+def test_fetch_feeds_memoises_within_run(monkeypatch, tmp_path):
+    rss = (
+        b'<?xml version="1.0"?><rss version="2.0"><channel><title>f</title>'
+        b"<item><title>A</title><link>https://example.com/a</link></item></channel></rss>"
+    )
+    calls = []
+
+    monkeypatch.setattr(feed_cache, "_get_cache_path", lambda: tmp_path / "feed_cache.json")
+    monkeypatch.setattr(feed_cache, "_dirty", False)
+    monkeypatch.setattr(search, "_FEED_MEMO", search.TTLCache(max_items=4))
+    monkeypatch.setattr(search._HTTP, "get", _fake_feed_get(calls, lambda url, headers: _FeedResponse(200, rss)))
+
+    search._fetch_feeds(["https://example.com/feed", "https://example.com/other"])
+    search._fetch_feed("https://example.com/feed")
+    assert sorted(url for url, _ in calls) == ["https://example.com/feed", "https://example.com/other"]
+
+
+def test_fast_feed_matches_feedparser_fields():
+    rss = (
+        b'<?xml version="1.0"?><rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        b"<channel><title>c</title>"
+        b"<item><title> A &amp; B </title><link>/a</link><description>&lt;p&gt;Body&lt;/p&gt;</description>"
+        b"<pubDate>Mon, 12 Oct 2026 10:00:00 +0200</pubDate></item>"
+        b'<item><title>C</title><guid isPermaLink="true">https://example.com/c</guid>'
+        b"<dc:date>2026-10-12T10:00:00Z</dc:date></item></channel></rss>"
+    )
+    atom = (
+        b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>f</title>'
+        b'<entry><title type="html">&lt;b&gt;AI&lt;/b&gt;</title><link rel="self" href="https://example.com/s"/>'
+        b'<link href="https://example.com/d"/><updated>2026-10-12T10:00:00Z</updated>'
+        b"<content>Text</content></entry></feed>"
+    )
+    for data in (rss, atom):
+        ours = fast_feed.parse(data, base_url="https://example.com/feed")
+        theirs = feedparser.parse(data, response_headers={"content-location": "https://example.com/feed"}).entries
+        for key in ("title", "link", "summary", "published"):
+            assert [e.get(key) for e in ours] == [e.get(key) for e in theirs], key
+
+
+def test_dedupe_ignores_query_fragment_and_case():
+    hits = [
+        ArticleHit(title="Big News ", url="https://Example.com/a?utm_source=x#top", snippet=""),
+        ArticleHit(title="big news", url="https://example.com/a", snippet=""),
+        ArticleHit(title="big news", url="https://example.com/b", snippet=""),
+    ]
+    assert [h.url for h in _dedupe(hits)] == [hits[0].url, hits[2].url]
+
+
+def test_boost_by_keywords_counts_overlapping_keywords():
+    hits = [
+        ArticleHit(title="AI news", url="https://example.com/1", snippet=""),
+        ArticleHit(title="OpenAI news", url="https://example.com/2", snippet=""),
+    ]
+    result = _boost_by_keywords(hits, ["openai", "AI"])
+    assert result[0].title == "OpenAI news"
+
+
+def test_get_streams_configs_cannot_be_mutated():
+    streams = get_streams(3)
+    assert streams["global"].limit == 3
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        streams["global"].limit = 99
+    assert get_streams()["global"].limit == DEFAULT_STREAMS["global"].limit
@@ -0,0 +1,50 @@
+import json
+
+from ai_newsletter_automation import summarize
+from ai_newsletter_automation.models import VerifiedArticle
+
+
+def _articles(n):
+    return [
+        VerifiedArticle(title=f"t{i}", url=f"https://example.com/{i}", snippet="", content="c")
+        for i in range(n)
+    ]
+
+
+def _prompt_urls(user_prompt):
+    return [line[5:] for line in user_prompt.splitlines() if line.startswith("URL: ")]
+
+
+def _items_json(urls):
+    return json.dumps([
+        {"Headline": u, "Summary_Text": "s", "Live_Link": u, "Relevance": 8} for u in urls
+    ])
+
+
+def test_summarize_section_batches_keep_article_order(monkeypatch):
+    prompts = []
+
+    def fake_request(system_prompt, user_prompt, model_name="", temperature=0.1):
+        prompts.append(user_prompt)
+        return _items_json(_prompt_urls(user_prompt))
+
+    monkeypatch.setattr(summarize, "_gemini_request", fake_request)
+    monkeypatch.setattr(summarize, "get_settings", lambda: None)
+    articles = _articles(6)
+    items = summarize.summarize_section("News", articles)
+    assert len(prompts) == 2
+    assert [it.Live_Link for it in items] == [a.url for a in articles]
+
+
+def test_summarize_section_keeps_batches_that_succeed(monkeypatch):
+    def fake_request(system_prompt, user_prompt, model_name="", temperature=0.1):
+        urls = _prompt_urls(user_prompt)
+        if "https://example.com/0" in urls:
+            raise RuntimeError("quota exhausted")
+        return _items_json(urls)
+
+    monkeypatch.setattr(summarize, "_gemini_request", fake_request)
+    monkeypatch.setattr(summarize, "get_settings", lambda: None)
+    articles = _articles(6)
+    items = summarize.summarize_section("News", articles)
+    assert [it.Live_Link for it in items] == [a.url for a in articles[4:]]
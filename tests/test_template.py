@@ -1,4 +1,7 @@
-from ai_newsletter_automation.assemble import render_newsletter
+from jinja2 import Environment
+from jinja2.bccache import Bucket
+
+from ai_newsletter_automation.assemble import _BestEffortBytecodeCache, render_newsletter
 from ai_newsletter_automation.models import SummaryItem
 
 
@@ -60,3 +63,9 @@ def test_render_hides_empty_sections():
     assert "Trending" not in html
     assert "Global" not in html
 
+
+def test_bytecode_cache_ignores_write_errors(tmp_path):
+    cache = _BestEffortBytecodeCache(directory=str(tmp_path / "missing"))
+    bucket = Bucket(Environment(), "key", "checksum")
+    bucket.code = compile("1", "<template>", "eval")
+    cache.dump_bytecode(bucket)  # must not raise
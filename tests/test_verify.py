@@ -1,6 +1,18 @@
+import io
+
+import requests
+
+from ai_newsletter_automation import verify
 from ai_newsletter_automation.verify import is_paywalled
 
 
+def _response(body, encoding):
+    resp = requests.Response()
+    resp.raw = io.BytesIO(body)
+    resp.encoding = encoding
+    return resp
+
+
 def test_paywall_detection_simple():
     html = "<html><body>Subscribe to read this article</body></html>"
     assert is_paywalled(html) is True
@@ -10,3 +22,41 @@ def test_paywall_detection_allows_free():
     html = "<html><body>This article is free to read</body></html>"
     assert is_paywalled(html) is False
 
+
+def test_verify_link_caches_by_normalized_url(monkeypatch):
+    calls = []
+
+    def fake_fetch(url, timeout):
+        calls.append(url)
+        return None
+
+    verify._URL_CACHE.clear()
+    monkeypatch.setattr(verify, "_fetch_and_verify", fake_fetch)
+    assert verify.verify_link("https://Example.com/story/") is None
+    assert verify.verify_link("https://example.com/story#comments") is None
+    assert calls == ["https://Example.com/story/"]
+    verify._URL_CACHE.clear()
+
+
+def test_read_capped_stops_at_limit():
+    text = verify.read_capped(_response(b"<p>" + b"x" * 300_000 + b"</p>", "utf-8"), limit=100_000)
+    assert len(text) == 100_000
+    assert text.startswith("<p>x")
+
+
+def test_host_slot_drops_idle_hosts():
+    with verify.host_slot("https://a.example/1"):
+        with verify.host_slot("https://A.example/2"):
+            assert list(verify._HOST_SLOTS) == ["a.example"]
+            assert verify._HOST_SLOTS["a.example"].users == 2
+    assert "a.example" not in verify._HOST_SLOTS
+
+
+def test_session_does_not_retry_read_timeouts():
+    retry = verify.SESSION.get_adapter("https://example.com").max_retries
+    assert retry.read == 0
+    assert retry.connect == 1
+
+
+def test_read_capped_falls_back_on_unknown_charset():
+    assert verify.read_capped(_response("café".encode("utf-8"), "utf8mb4")) == "café"